@@ -0,0 +1,235 @@
+"""
+Shared helpers for the Vercel serverless functions.
+
+Files starting with an underscore are not deployed as endpoints,
+so this module is only ever imported by the handlers.
+
+It also holds everything the handlers share: the project root path
+fix, the algod/indexer clients and the common helpers. Handlers import
+from here so this setup runs once per worker instead of once per file.
+"""
+import os
+import sys
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import unquote_plus
+import msgpack
+import orjson
+
+# Make the project root importable (for the utils package)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from utils.algod_client import (
+    get_algod_client,
+    get_network_status,
+    get_suggested_params_cached
+)
+from utils.indexer_client import get_indexer_client, search_transactions_cached
+from utils.helpers import (
+    MICROALGOS_PER_ALGO,
+    microalgos_to_algos,
+    algos_to_microalgos,
+    validate_address,
+    poll_for_confirmation
+)
+
+# The utils factories return one shared client per process, which is
+# reused across invocations while Vercel keeps the container warm
+get_algod = get_algod_client
+get_indexer = get_indexer_client
+
+
+# Short-lived account_info cache shared by the handlers, for frontends
+# polling the same address. The TTL is well under one round (~3.3s), so
+# balances are at most one round stale.
+ACCOUNT_CACHE_TTL = 2.0
+ACCOUNT_CACHE_MAX = 1024
+_ACCT_CACHE = {}
+
+
+def get_account_info_cached(client, address):
+    """Returns account_info for address, reusing a fresh cached copy."""
+    now = time.monotonic()
+    hit = _ACCT_CACHE.get(address)
+    if hit and now - hit[0] < ACCOUNT_CACHE_TTL:
+        return hit[1]
+
+    # The handlers only read header fields (amount, min-balance, ...),
+    # so skip the asset/app lists
+    info = client.account_info(address, exclude="all")
+    if len(_ACCT_CACHE) >= ACCOUNT_CACHE_MAX:
+        _ACCT_CACHE.clear()
+    _ACCT_CACHE[address] = (now, info)
+    return info
+
+
+def invalidate_account(*addresses):
+    """Drops cached account_info, e.g. after a transaction moved funds."""
+    for address in addresses:
+        _ACCT_CACHE.pop(address, None)
+
+
+def _json_header_block(status, content_type=b"application/json"):
+    """Builds the status line and static headers for a response."""
+    return (
+        b"HTTP/1.1 %d %s\r\n" % (status, HTTPStatus(status).phrase.encode())
+        + b"Content-Type: %s\r\n" % content_type
+        + b"Access-Control-Allow-Origin: *\r\n"
+        + b"Connection: close\r\n"
+    )
+
+
+# Header blocks are built once at import instead of per response
+_JSON_HEADERS = {
+    status: _json_header_block(status)
+    for status in (200, 400, 404, 500, 503)
+}
+_MSGPACK_HEADERS = _json_header_block(200, b"application/msgpack")
+_NOT_MODIFIED = (
+    b"HTTP/1.1 304 Not Modified\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Connection: close\r\n"
+)
+
+# Complete CORS preflight response for the POST endpoints. Max-Age lets
+# browsers cache it for a day instead of asking before every POST.
+PREFLIGHT = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: POST, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type\r\n"
+    b"Access-Control-Max-Age: 86400\r\n"
+    b"Content-Length: 0\r\n"
+    b"Connection: close\r\n"
+    b"\r\n"
+)
+
+
+def parse_query(path):
+    """
+    Parses the query string of a request path into a flat dict.
+
+    A lighter replacement for parse_qs(urlparse(path).query) for the
+    single-valued parameters these endpoints take. Like parse_qs, the
+    first value of a repeated key wins and blank values are dropped.
+
+    Args:
+        path: Request path, e.g. "/api/balance?address=XXXX"
+
+    Returns:
+        dict: Parameter name -> decoded value
+    """
+    params = {}
+    query = path.partition('?')[2]
+    if not query:
+        return params
+
+    for pair in query.split('&'):
+        key, sep, value = pair.partition('=')
+        if sep and value:
+            params.setdefault(unquote_plus(key), unquote_plus(value))
+    return params
+
+
+def error_body(message):
+    """Serializes an error payload; used to build constant error bodies."""
+    return orjson.dumps({"error": message})
+
+
+# Error bodies shared by several handlers
+ERR_ADDRESS_REQUIRED = error_body("Address parameter is required")
+ERR_INVALID_ADDRESS = error_body("Invalid Algorand address")
+
+
+class ApiError(Exception):
+    """
+    An error that maps directly to an HTTP error response.
+
+    Raised from a handler method, it is turned into a JSON error response
+    by JSONRequestHandler, so handlers don't need their own try/except.
+
+    Args:
+        status: HTTP status code
+        body: Pre-serialized body (bytes, see error_body) or a message
+    """
+
+    def __init__(self, status, body):
+        if isinstance(body, str):
+            body = error_body(body)
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+
+
+class JSONRequestHandler(BaseHTTPRequestHandler):
+    """
+    Base handler that writes each JSON response with a single write.
+
+    Instead of send_response() + send_header() x N + end_headers() +
+    write(), the precomputed header block, Content-Length and body are
+    concatenated and written at once.
+
+    Exceptions escaping a do_* method are handled here in one place:
+    ApiError becomes its status and body, anything else a 500 with the
+    exception message.
+    """
+
+    def handle_one_request(self):
+        try:
+            super().handle_one_request()
+        except ApiError as e:
+            self._write_body(e.status, e.body)
+        except Exception as e:
+            self._write_error(500, str(e))
+
+    def _write_body(self, status, body, headers=None):
+        if headers is None:
+            headers = _JSON_HEADERS.get(status) or _json_header_block(status)
+        self.close_connection = True
+        self.wfile.write(
+            headers + b"Content-Length: %d\r\n\r\n" % len(body) + body
+        )
+
+    def _write_preflight(self):
+        self.close_connection = True
+        self.wfile.write(PREFLIGHT)
+
+    def _write_json(self, status, obj):
+        self._write_body(status, orjson.dumps(obj))
+
+    def _write_json_cached(self, obj, etag, max_age):
+        """
+        Writes a cacheable 200 JSON response, or 304 if the client
+        already holds the representation identified by `etag`.
+
+        Args:
+            obj: Response payload
+            etag: ETag value (str), e.g. 'W/"round-123"'
+            max_age: Seconds clients and CDNs may reuse the response
+        """
+        cache_headers = (
+            b"ETag: %s\r\nCache-Control: public, max-age=%d\r\n"
+            % (etag.encode(), max_age)
+        )
+
+        if_none_match = self.headers.get('If-None-Match', '')
+        if etag in (tag.strip() for tag in if_none_match.split(',')):
+            self.close_connection = True
+            self.wfile.write(_NOT_MODIFIED + cache_headers + b"\r\n")
+            return
+
+        self._write_body(
+            200, orjson.dumps(obj), _JSON_HEADERS[200] + cache_headers
+        )
+
+    def _write_msgpack(self, obj):
+        """Writes a 200 response as MessagePack instead of JSON."""
+        self._write_body(
+            200, msgpack.packb(obj, use_bin_type=True), _MSGPACK_HEADERS
+        )
+
+    def _write_error(self, status, message):
+        self._write_json(status, {"error": message})
@@ -2,73 +2,66 @@
 Vercel Serverless Function: Check Balance
 GET /api/balance?address=XXXX
 """
-from http.server import BaseHTTPRequestHandler
-import json
-import sys
-import os
-from urllib.parse import parse_qs, urlparse
+from algosdk.error import AlgodHTTPError
+from api._common import (
+    ApiError,
+    JSONRequestHandler,
+    parse_query,
+    ERR_ADDRESS_REQUIRED,
+    ERR_INVALID_ADDRESS,
+    error_body,
+    ACCOUNT_CACHE_TTL,
+    get_account_info_cached,
+    get_algod,
+    MICROALGOS_PER_ALGO,
+    validate_address
+)
 
-# Add parent directories to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from utils.algod_client import get_algod_client
-from utils.helpers import microalgos_to_algos, validate_address
+# Static error responses, serialized once at import
+ERR_ACCOUNT_NOT_FOUND = error_body("Account not found. Fund it at https://bank.testnet.algorand.network/")
 
-class handler(BaseHTTPRequestHandler):
+
+class handler(JSONRequestHandler):
     def do_GET(self):
+        # Parse query parameters
+        params = parse_query(self.path)
+        address = params.get('address')
+        
+        if not address:
+            self._write_body(400, ERR_ADDRESS_REQUIRED)
+            return
+        
+        # Validate address
+        if not validate_address(address):
+            self._write_body(400, ERR_INVALID_ADDRESS)
+            return
+        
+        # Get client and account info
+        client = get_algod()
         try:
-            # Parse query parameters
-            query = urlparse(self.path).query
-            params = parse_qs(query)
-            address = params.get('address', [None])[0]
-            
-            if not address:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Address parameter is required"}).encode())
-                return
-            
-            # Validate address
-            if not validate_address(address):
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Invalid Algorand address"}).encode())
-                return
-            
-            # Get client and account info
-            client = get_algod_client()
-            account_info = client.account_info(address)
-            
-            balance = account_info.get('amount', 0)
-            min_balance = account_info.get('min-balance', 100_000)
-            
-            response = {
-                "address": address,
-                "balance_algo": microalgos_to_algos(balance),
-                "balance_microalgos": balance,
-                "min_balance_algo": microalgos_to_algos(min_balance),
-                "available_algo": microalgos_to_algos(balance - min_balance),
-                "status": account_info.get('status', 'Unknown'),
-                "round": account_info.get('round', 0)
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
-            
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "no accounts found" in error_msg or "account does not exist" in error_msg:
-                self.send_response(404)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Account not found. Fund it at https://bank.testnet.algorand.network/"}).encode())
-            else:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": str(e)}).encode())
+            account_info = get_account_info_cached(client, address)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                raise ApiError(404, ERR_ACCOUNT_NOT_FOUND) from e
+            raise
+        
+        balance = account_info.get('amount', 0)
+        min_balance = account_info.get('min-balance', 100_000)
+        
+        # Inline the microAlgo -> Algo conversions (division keeps
+        # values like 0.1 exact, unlike multiplying by 1e-6)
+        unit = MICROALGOS_PER_ALGO
+        response = {
+            "address": address,
+            "balance_algo": balance / unit,
+            "balance_microalgos": balance,
+            "min_balance_algo": min_balance / unit,
+            "available_algo": (balance - min_balance) / unit,
+            "status": account_info.get('status', 'Unknown'),
+            "round": account_info.get('round', 0)
+        }
+        
+        # Account data is as of a round, so (address, round) identifies it
+        etag = 'W/"%s-%d"' % (address, response["round"])
+        self._write_json_cached(response, etag, int(ACCOUNT_CACHE_TTL))
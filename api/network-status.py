@@ -2,41 +2,54 @@
 Vercel Serverless Function: Network Status
 GET /api/network-status
 """
-from http.server import BaseHTTPRequestHandler
-import json
-import sys
-import os
+import time
 
-# Add parent directories to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from api._common import (
+    JSONRequestHandler,
+    error_body,
+    get_algod,
+    get_network_status
+)
 
-from utils.algod_client import get_algod_client, get_network_status
 
-class handler(BaseHTTPRequestHandler):
+# Static error responses, serialized once at import
+ERR_NETWORK_UNAVAILABLE = error_body("Unable to connect to network")
+
+# The last round only advances every ~3.3s, so a status response is
+# reused briefly instead of asking algod on every poll
+STATUS_TTL = 2.0
+_status_cache = None  # (fetched_at, status)
+
+
+def _cached_status(client):
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache and now - _status_cache[0] < STATUS_TTL:
+        return _status_cache[1]
+
+    status = get_network_status(client)
+    if status:
+        _status_cache = (now, status)
+    return status
+
+
+class handler(JSONRequestHandler):
     def do_GET(self):
-        try:
-            client = get_algod_client()
-            status = get_network_status(client)
-            
-            if not status:
-                self.send_error(503, "Unable to connect to network")
-                return
-            
-            response = {
-                "status": "online",
-                "current_round": status.get('last-round', 0),
-                "network": "TestNet",
-                "connected": True
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
-            
-        except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+        client = get_algod()
+        status = _cached_status(client)
+        
+        if not status:
+            self._write_body(503, ERR_NETWORK_UNAVAILABLE)
+            return
+        
+        current_round = status.get('last-round', 0)
+        response = {
+            "status": "online",
+            "current_round": current_round,
+            "network": "TestNet",
+            "connected": True
+        }
+        
+        # The response only changes when a new round is produced
+        etag = 'W/"round-%d"' % current_round
+        self._write_json_cached(response, etag, int(STATUS_TTL))
@@ -3,128 +3,137 @@ Vercel Serverless Function: Send Transaction
 POST /api/send-transaction
 Body: { "sender_mnemonic": "...", "receiver_address": "...", "amount_algo": 1.5, "note": "..." }
 """
-from http.server import BaseHTTPRequestHandler
-import json
-import sys
-import os
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directories to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
-from algosdk import account, mnemonic, transaction
-from utils.algod_client import get_algod_client
-from utils.helpers import (
+from algosdk import transaction
+from algosdk.error import AlgodHTTPError
+from api._common import (
+    ApiError,
+    JSONRequestHandler,
+    error_body,
+    get_account_info_cached,
+    get_algod,
+    get_suggested_params_cached,
+    invalidate_account,
     microalgos_to_algos,
     algos_to_microalgos,
     validate_address,
-    wait_for_confirmation
+    poll_for_confirmation
 )
+from utils.mnemonic_fast import recover_from_mnemonic
+
+# Runs independent algod calls concurrently
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
 
-class handler(BaseHTTPRequestHandler):
+# Static error responses, serialized once at import
+ERR_INVALID_INPUT = error_body("Invalid input parameters")
+ERR_INVALID_RECEIVER = error_body("Invalid receiver address")
+ERR_SEND_TO_SELF = error_body("Cannot send to the same address")
+ERR_INVALID_MNEMONIC = error_body("Invalid mnemonic phrase")
+
+
+class handler(JSONRequestHandler):
     def do_POST(self):
+        # Parse request body
+        content_length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(content_length)
+        data = orjson.loads(body)
+        
+        sender_mnemonic = data.get('sender_mnemonic', '').strip()
+        receiver_address = data.get('receiver_address', '').strip()
+        amount_algo = float(data.get('amount_algo', 0))
+        note_text = data.get('note', '').strip()
+        
+        # Validate inputs
+        if not sender_mnemonic or not receiver_address or amount_algo <= 0:
+            self._write_body(400, ERR_INVALID_INPUT)
+            return
+        
+        # Validate receiver address, then recover the sender account.
+        # The mnemonic's words and checksum are checked before any key
+        # derivation, and all of it happens before any RPC.
+        if not validate_address(receiver_address):
+            self._write_body(400, ERR_INVALID_RECEIVER)
+            return
+        try:
+            sender_private_key, sender_address = recover_from_mnemonic(sender_mnemonic)
+        except ValueError:
+            self._write_body(400, ERR_INVALID_MNEMONIC)
+            return
+        
+        # Prevent sending to self
+        if sender_address == receiver_address:
+            self._write_body(400, ERR_SEND_TO_SELF)
+            return
+        
+        # Convert amount to microAlgos
+        amount_microalgos = algos_to_microalgos(amount_algo)
+        
+        # Fetch suggested params and sender info concurrently (the latter
+        # served from cache if the frontend just checked this balance)
+        client = get_algod()
+        params_future = _EXECUTOR.submit(get_suggested_params_cached, client)
+        info_future = _EXECUTOR.submit(
+            get_account_info_cached, client, sender_address
+        )
+        params = params_future.result()
+        sender_info = info_future.result()
+        
+        # Verify sender balance
+        sender_balance = sender_info.get('amount', 0)
+        min_balance = sender_info.get('min-balance', 100_000)
+        
+        total_needed = amount_microalgos + params.fee + min_balance
+        
+        if sender_balance < total_needed:
+            # The cached balance may be slightly stale; refetch next time
+            invalidate_account(sender_address)
+            error_msg = f"Insufficient balance. Need {microalgos_to_algos(total_needed)} ALGO, have {microalgos_to_algos(sender_balance)} ALGO"
+            self._write_error(400, error_msg)
+            return
+        
+        # Create transaction
+        note_bytes = note_text.encode() if note_text else None
+        
+        txn = transaction.PaymentTxn(
+            sender=sender_address,
+            sp=params,
+            receiver=receiver_address,
+            amt=amount_microalgos,
+            note=note_bytes
+        )
+        
+        # Sign transaction
+        signed_txn = txn.sign(sender_private_key)
+        
+        # Send transaction. The pre-check may have used a cached
+        # balance, so the node has the final say on overspending.
         try:
-            # Parse request body
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-            data = json.loads(body)
-            
-            sender_mnemonic = data.get('sender_mnemonic', '').strip()
-            receiver_address = data.get('receiver_address', '').strip()
-            amount_algo = float(data.get('amount_algo', 0))
-            note_text = data.get('note', '').strip()
-            
-            # Validate inputs
-            if not sender_mnemonic or not receiver_address or amount_algo <= 0:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Invalid input parameters"}).encode())
-                return
-            
-            # Recover sender account
-            sender_private_key = mnemonic.to_private_key(sender_mnemonic)
-            sender_address = account.address_from_private_key(sender_private_key)
-            
-            # Validate receiver address
-            if not validate_address(receiver_address):
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Invalid receiver address"}).encode())
-                return
-            
-            # Prevent sending to self
-            if sender_address == receiver_address:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Cannot send to the same address"}).encode())
-                return
-            
-            # Convert amount to microAlgos
-            amount_microalgos = algos_to_microalgos(amount_algo)
-            
-            # Get client and params
-            client = get_algod_client()
-            params = client.suggested_params()
-            
-            # Verify sender balance
-            sender_info = client.account_info(sender_address)
-            sender_balance = sender_info.get('amount', 0)
-            min_balance = sender_info.get('min-balance', 100_000)
-            
-            total_needed = amount_microalgos + params.fee + min_balance
-            
-            if sender_balance < total_needed:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                error_msg = f"Insufficient balance. Need {microalgos_to_algos(total_needed)} ALGO, have {microalgos_to_algos(sender_balance)} ALGO"
-                self.wfile.write(json.dumps({"error": error_msg}).encode())
-                return
-            
-            # Create transaction
-            note_bytes = note_text.encode() if note_text else None
-            
-            txn = transaction.PaymentTxn(
-                sender=sender_address,
-                sp=params,
-                receiver=receiver_address,
-                amt=amount_microalgos,
-                note=note_bytes
-            )
-            
-            # Sign transaction
-            signed_txn = txn.sign(sender_private_key)
-            
-            # Send transaction
             txid = client.send_transaction(signed_txn)
-            
-            # Wait for confirmation (with timeout)
-            confirmed_txn = wait_for_confirmation(client, txid, timeout=10)
-            
-            response = {
-                "success": True,
-                "transaction_id": txid,
-                "confirmed_round": confirmed_txn.get('confirmed-round') if confirmed_txn else None,
-                "message": "Transaction sent successfully"
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
-            
-        except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+        except AlgodHTTPError as e:
+            invalidate_account(sender_address)
+            # algod reports both as a plain 400; only the text differs
+            message = str(e)
+            if e.code == 400 and ("overspend" in message or "below min" in message):
+                raise ApiError(400, message) from e
+            raise
+        
+        # Both balances change once the payment lands
+        invalidate_account(sender_address, receiver_address)
+        
+        # Poll for confirmation within the function's time budget
+        confirmed_txn = poll_for_confirmation(client, txid)
+        
+        response = {
+            "success": True,
+            "transaction_id": txid,
+            "confirmed_round": confirmed_txn.get('confirmed-round') if confirmed_txn else None,
+            "message": "Transaction sent successfully"
+        }
+        
+        self._write_json(200, response)
     
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        self._write_preflight()
@@ -2,84 +2,77 @@
 Vercel Serverless Function: Transaction Status
 GET /api/transaction-status?txid=XXXX
 """
-from http.server import BaseHTTPRequestHandler
-import json
-import sys
-import os
-import base64
-from urllib.parse import parse_qs, urlparse
+from binascii import a2b_base64
 
-# Add parent directories to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from algosdk.error import AlgodHTTPError
+from api._common import (
+    ApiError,
+    JSONRequestHandler,
+    parse_query,
+    error_body,
+    get_algod,
+    MICROALGOS_PER_ALGO
+)
 
-from utils.algod_client import get_algod_client
-from utils.helpers import microalgos_to_algos
 
-class handler(BaseHTTPRequestHandler):
+# Static error responses, serialized once at import
+ERR_TXID_REQUIRED = error_body("Transaction ID is required")
+ERR_TXN_NOT_FOUND = error_body("Transaction not found")
+
+
+class handler(JSONRequestHandler):
     def do_GET(self):
+        # Parse query parameters
+        params = parse_query(self.path)
+        txid = params.get('txid')
+        
+        if not txid:
+            self._write_body(400, ERR_TXID_REQUIRED)
+            return
+        
+        client = get_algod()
+        
+        # Get pending transaction info
         try:
-            # Parse query parameters
-            query = urlparse(self.path).query
-            params = parse_qs(query)
-            txid = params.get('txid', [None])[0]
-            
-            if not txid:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Transaction ID is required"}).encode())
-                return
-            
-            client = get_algod_client()
-            
-            # Get pending transaction info
             pending_info = client.pending_transaction_info(txid)
-            
-            confirmed_round = pending_info.get('confirmed-round', 0)
-            
-            # Extract transaction details
-            txn_data = pending_info.get('txn', {}).get('txn', {})
-            
-            sender = txn_data.get('snd', None)
-            receiver = txn_data.get('rcv', None)
-            amount = txn_data.get('amt', 0)
-            fee = txn_data.get('fee', 0)
-            note = txn_data.get('note', None)
-            
-            # Try to decode note
-            note_text = None
-            if note:
-                try:
-                    note_text = base64.b64decode(note).decode('utf-8')
-                except:
-                    pass
-            
-            response = {
-                "transaction_id": txid,
-                "confirmed": confirmed_round > 0,
-                "confirmed_round": confirmed_round if confirmed_round > 0 else None,
-                "sender": sender,
-                "receiver": receiver,
-                "amount_algo": microalgos_to_algos(amount) if amount > 0 else None,
-                "fee_algo": microalgos_to_algos(fee) if fee > 0 else None,
-                "note": note_text
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
-            
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "not found" in error_msg or "transaction not found" in error_msg:
-                self.send_response(404)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": "Transaction not found"}).encode())
-            else:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({"error": str(e)}).encode())
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                raise ApiError(404, ERR_TXN_NOT_FOUND) from e
+            raise
+        
+        confirmed_round = pending_info.get('confirmed-round', 0)
+        
+        # Extract transaction details
+        txn_data = pending_info.get('txn', {}).get('txn', {})
+        
+        sender = txn_data.get('snd', None)
+        receiver = txn_data.get('rcv', None)
+        amount = txn_data.get('amt', 0)
+        fee = txn_data.get('fee', 0)
+        note = txn_data.get('note', None)
+        
+        # Try to decode note
+        note_text = None
+        if note:
+            try:
+                # Raw bytes need no decoding; JSON responses carry base64 text
+                raw = note if isinstance(note, bytes) else a2b_base64(note)
+                note_text = raw.decode('utf-8')
+            except ValueError:
+                # Invalid base64 (binascii.Error) or a binary, non-UTF-8
+                # note (UnicodeDecodeError); both are ValueErrors
+                pass
+        
+        response = {
+            "transaction_id": txid,
+            "confirmed": confirmed_round > 0,
+            "confirmed_round": confirmed_round if confirmed_round > 0 else None,
+            "sender": sender,
+            "receiver": receiver,
+            # A zero amount/fee divides to 0.0, which maps to None
+            "amount_algo": (amount / MICROALGOS_PER_ALGO) or None,
+            "fee_algo": (fee / MICROALGOS_PER_ALGO) or None,
+            "note": note_text
+        }
+        
+        self._write_json(200, response)
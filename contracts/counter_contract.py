@@ -16,8 +16,19 @@ Key Concepts:
 - Application calls: Transactions that invoke contract logic
 """
 
+import os
+import sys
+from functools import lru_cache
+
 from pyteal import *
 
+# Add parent directory to path when run as a file. Loaded through
+# utils.loader or as a module, the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pyteal_compile import compile_program
+
 
 def counter_contract():
     """
@@ -143,6 +154,8 @@ def get_local_schema():
     return (0, 0)
 
 
+# Compilation is deterministic, so each result is computed only once
+@lru_cache(maxsize=None)
 def compile_contract():
     """
     Compiles the counter contract to TEAL.
@@ -152,19 +165,11 @@ def compile_contract():
     """
     # Compile approval program
     approval_program = counter_contract()
-    approval_teal = compileTeal(
-        approval_program,
-        mode=Mode.Application,
-        version=8
-    )
+    approval_teal = compile_program(approval_program)
     
     # Compile clear state program
     clear_program = clear_state_program()
-    clear_teal = compileTeal(
-        clear_program,
-        mode=Mode.Application,
-        version=8
-    )
+    clear_teal = compile_program(clear_program)
     
     return approval_teal, clear_teal
 
@@ -15,8 +15,19 @@ This contract demonstrates:
 - How to compile contracts to TEAL
 """
 
+import os
+import sys
+from functools import lru_cache
+
 from pyteal import *
 
+# Add parent directory to path when run as a file. Loaded through
+# utils.loader or as a module, the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pyteal_compile import compile_program
+
 
 def hello_world_contract():
     """
@@ -54,6 +65,8 @@ def clear_state_program():
     return Return(Int(1))
 
 
+# Compilation is deterministic, so each result is computed only once
+@lru_cache(maxsize=None)
 def compile_contract():
     """
     Compiles the PyTeal contract to TEAL.
@@ -67,19 +80,11 @@ def compile_contract():
     """
     # Compile approval program
     approval_program = hello_world_contract()
-    approval_teal = compileTeal(
-        approval_program,
-        mode=Mode.Application,
-        version=8  # TEAL version 8 (latest stable)
-    )
+    approval_teal = compile_program(approval_program)
     
     # Compile clear state program
     clear_program = clear_state_program()
-    clear_teal = compileTeal(
-        clear_program,
-        mode=Mode.Application,
-        version=8
-    )
+    clear_teal = compile_program(clear_program)
     
     return approval_teal, clear_teal
 
@@ -110,7 +115,7 @@ if __name__ == "__main__":
     print("\n💡 EXPLANATION:")
     print("   The TEAL code you see above is what actually runs on the blockchain.")
     print("   PyTeal is just a Python DSL that generates this TEAL code.")
-    print("\n   'int 1' = push integer 1 onto stack")
+    print("\n   'pushint 1' = push integer 1 onto stack")
     print("   'return' = return the top of stack (1 = approve, 0 = reject)")
     
     print("\n📚 KEY CONCEPTS:")
@@ -16,6 +16,8 @@ Key Concepts:
 - Conditional logic based on blockchain state
 """
 
+from functools import lru_cache
+
 from pyteal import *
 
 
@@ -111,6 +113,8 @@ def timelock_with_escape_hatch(unlock_round, owner_address):
     return program
 
 
+# Compilation is deterministic; recently used unlock rounds are cached
+@lru_cache(maxsize=128)
 def compile_timelock(unlock_round):
     """
     Compiles a basic timelock contract to TEAL.
@@ -0,0 +1 @@
+"""Tools to compile and deploy the PyTeal contracts."""
@@ -16,38 +16,16 @@ This script:
 - Shows the compiled output
 """
 
+import io
 import sys
 import os
-import importlib.util
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m deploy.compile_contract) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-
-def import_contract_module(contract_path):
-    """
-    Dynamically imports a Python contract module.
-    
-    Args:
-        contract_path: Path to the .py contract file
-        
-    Returns:
-        module: The imported Python module
-    """
-    try:
-        # Get module name from file path
-        module_name = os.path.splitext(os.path.basename(contract_path))[0]
-        
-        # Load the module dynamically
-        spec = importlib.util.spec_from_file_location(module_name, contract_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        
-        return module
-        
-    except Exception as e:
-        print(f"❌ Error importing contract: {str(e)}")
-        return None
+from utils.pipeline import ContractError, compile_contract_cached, save_teal
 
 
 def compile_contract_file(contract_path):
@@ -61,111 +39,98 @@ def compile_contract_file(contract_path):
         tuple: (approval_teal, clear_teal, metadata) or (None, None, None)
     """
     print(f"\n⏳ Loading contract from: {contract_path}")
-    
-    # Import the contract module
-    contract_module = import_contract_module(contract_path)
-    if not contract_module:
-        return None, None, None
-    
-    # Check if module has compile_contract function
-    if not hasattr(contract_module, 'compile_contract'):
-        print(f"❌ Error: Contract must have a 'compile_contract()' function")
-        return None, None, None
-    
     print("⏳ Compiling PyTeal to TEAL...")
     
-    # Call the compile function
+    # Compile (or reuse the cached TEAL if the contract is unchanged)
     try:
-        approval_teal, clear_teal = contract_module.compile_contract()
-        
-        # Get metadata if available
-        metadata = {}
-        if hasattr(contract_module, 'get_global_schema'):
-            metadata['global_schema'] = contract_module.get_global_schema()
-        if hasattr(contract_module, 'get_local_schema'):
-            metadata['local_schema'] = contract_module.get_local_schema()
-        
-        return approval_teal, clear_teal, metadata
-        
+        return compile_contract_cached(contract_path)
+    except ContractError as e:
+        print(f"❌ Error: {str(e)}")
+        return None, None, None
     except Exception as e:
         print(f"❌ Error during compilation: {str(e)}")
         return None, None, None
 
 
-def save_teal_to_file(contract_name, approval_teal, clear_teal):
+def save_teal_to_file(contract_name, approval_teal, clear_teal, metadata=None, contract_path=None):
     """
     Saves compiled TEAL code to files.
     
+    The schemas are saved alongside, so deploy_contract.py can use the
+    saved files without recompiling the contract.
+    
     Args:
         contract_name: Name of the contract
         approval_teal: Approval program TEAL code
         clear_teal: Clear state program TEAL code
+        metadata: Contract metadata (schemas, etc.)
+        contract_path: Contract the TEAL was compiled from; needed for
+            deploy_contract.py to reuse the files
         
     Returns:
         tuple: (approval_path, clear_path)
     """
-    # Create output directory
-    output_dir = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        "compiled"
-    )
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Create file paths
-    approval_path = os.path.join(output_dir, f"{contract_name}_approval.teal")
-    clear_path = os.path.join(output_dir, f"{contract_name}_clear.teal")
-    
-    # Write approval program
-    with open(approval_path, 'w') as f:
-        f.write(approval_teal)
-    
-    # Write clear state program
-    with open(clear_path, 'w') as f:
-        f.write(clear_teal)
+    return save_teal(contract_name, approval_teal, clear_teal, metadata, contract_path)
+
+
+def count_lines(text):
+    """
+    Counts the lines in a block of text, like len(text.splitlines())
+    but without building the list of lines.
     
-    return approval_path, clear_path
+    Args:
+        text: Text to count (e.g. a TEAL program)
+        
+    Returns:
+        int: Number of lines
+    """
+    if not text:
+        return 0
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
 
 
 def display_compilation_result(contract_name, approval_teal, clear_teal, metadata):
     """
     Displays the compilation result in a user-friendly format.
     
+    The output is assembled in memory and written to stdout at once,
+    rather than with one print() per line.
+    
     Args:
         contract_name: Name of the contract
         approval_teal: Compiled approval program
         clear_teal: Compiled clear state program
         metadata: Contract metadata (schemas, etc.)
     """
-    print("\n" + "=" * 70)
-    print(f"COMPILED: {contract_name.upper()}")
-    print("=" * 70)
+    separator = "=" * 70
+    divider = "-" * 70
+    
+    out = io.StringIO()
+    write = out.write
+    
+    write(f"\n{separator}\nCOMPILED: {contract_name.upper()}\n{separator}\n")
     
     # Display metadata if available
     if metadata:
         if 'global_schema' in metadata:
             g = metadata['global_schema']
-            print(f"\n📊 Global Schema: {g[0]} uints, {g[1]} byte slices")
+            write(f"\n📊 Global Schema: {g[0]} uints, {g[1]} byte slices\n")
         if 'local_schema' in metadata:
             l = metadata['local_schema']
-            print(f"📊 Local Schema:  {l[0]} uints, {l[1]} byte slices")
+            write(f"📊 Local Schema:  {l[0]} uints, {l[1]} byte slices\n")
     
-    # Display approval program
-    print("\n✅ APPROVAL PROGRAM:")
-    print("-" * 70)
-    print(approval_teal)
-    print("-" * 70)
-    print(f"   Size: {len(approval_teal)} bytes")
-    print(f"   Lines: {len(approval_teal.splitlines())} lines")
+    # Display both programs
+    for title, teal in (("APPROVAL PROGRAM", approval_teal), ("CLEAR STATE PROGRAM", clear_teal)):
+        write(f"\n✅ {title}:\n{divider}\n")
+        write(teal)
+        write(f"\n{divider}\n")
+        write(f"   Size: {len(teal)} bytes\n")
+        write(f"   Lines: {count_lines(teal)} lines\n")
     
-    # Display clear state program
-    print("\n✅ CLEAR STATE PROGRAM:")
-    print("-" * 70)
-    print(clear_teal)
-    print("-" * 70)
-    print(f"   Size: {len(clear_teal)} bytes")
-    print(f"   Lines: {len(clear_teal.splitlines())} lines")
+    write(f"\n{separator}\n")
     
-    print("\n" + "=" * 70)
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 
 def list_available_contracts():
@@ -182,10 +147,12 @@ def list_available_contracts():
         return []
     
     # Find all .py files
-    contracts = [
-        f for f in os.listdir(contracts_dir)
-        if f.endswith('.py') and not f.startswith('__')
-    ]
+    with os.scandir(contracts_dir) as entries:
+        contracts = [
+            e.name for e in entries
+            if e.name.endswith('.py') and not e.name.startswith('__')
+            and e.is_file()
+        ]
     
     return contracts
 
@@ -262,7 +229,9 @@ def main():
         approval_path, clear_path = save_teal_to_file(
             base_name,
             approval_teal,
-            clear_teal
+            clear_teal,
+            metadata,
+            contract_path
         )
         print(f"\n✅ Saved compiled files:")
         print(f"   Approval: {approval_path}")
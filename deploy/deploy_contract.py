@@ -17,36 +17,18 @@ smart contract on the blockchain.
 
 import sys
 import os
-import base64
-import importlib.util
+from binascii import a2b_base64
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m deploy.deploy_contract) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from algosdk import transaction, mnemonic, account
-from utils.algod_client import get_algod_client
 from utils.helpers import wait_for_confirmation, microalgos_to_algos
-
-
-def import_contract_module(contract_path):
-    """
-    Imports a PyTeal contract module.
-    
-    Args:
-        contract_path: Path to contract .py file
-        
-    Returns:
-        module: Imported module or None
-    """
-    try:
-        module_name = os.path.splitext(os.path.basename(contract_path))[0]
-        spec = importlib.util.spec_from_file_location(module_name, contract_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        print(f"❌ Error importing contract: {str(e)}")
-        return None
+from utils.build_cache import source_key, read_cached, write_cached
+from utils.pipeline import ContractError, get_teal
+from utils.teal_check import find_invalid_line
 
 
 def compile_to_bytecode(client, source_code):
@@ -55,6 +37,8 @@ def compile_to_bytecode(client, source_code):
     
     The Algod node provides a compilation service that converts
     TEAL assembly language to the binary bytecode that runs on the AVM.
+    Results are cached on disk by source hash, so redeploying an
+    unchanged contract skips the round-trip to the node.
     
     Args:
         client: AlgodClient instance
@@ -63,9 +47,24 @@ def compile_to_bytecode(client, source_code):
     Returns:
         bytes: Compiled bytecode
     """
+    key = source_key(source_code)
+    bytecode = read_cached("bytecode", key)
+    if bytecode:
+        return bytecode
+    
+    # Catch obvious mistakes before paying for the round-trip
+    invalid = find_invalid_line(source_code)
+    if invalid:
+        line_number, line = invalid
+        print(f"❌ Error compiling TEAL to bytecode: unknown opcode on line {line_number}")
+        print(f"   {line.strip()}")
+        return None
+    
     try:
         compile_response = client.compile(source_code)
-        return base64.b64decode(compile_response['result'])
+        bytecode = a2b_base64(compile_response['result'])
+        write_cached("bytecode", key, bytecode)
+        return bytecode
     except Exception as e:
         print(f"❌ Error compiling TEAL to bytecode: {str(e)}")
         print("   This usually means there's a syntax error in the TEAL code")
@@ -88,6 +87,8 @@ def get_creator_credentials():
     if not mnemonic_phrase:
         return None, None
     
+    from algosdk import mnemonic, account
+    
     try:
         private_key = mnemonic.to_private_key(mnemonic_phrase)
         address = account.address_from_private_key(private_key)
@@ -119,6 +120,8 @@ def create_app_transaction(
     Returns:
         Transaction object
     """
+    from algosdk import transaction
+    
     # Get suggested parameters
     params = client.suggested_params()
     
@@ -159,38 +162,38 @@ def deploy_contract(contract_path):
     """
     print(f"\n⏳ Loading contract: {contract_path}")
     
-    # Import and compile the contract
-    contract_module = import_contract_module(contract_path)
-    if not contract_module:
-        return None
-    
-    if not hasattr(contract_module, 'compile_contract'):
+    # Compile the contract (or reuse TEAL saved by compile_contract.py /
+    # the build cache if the contract is unchanged)
+    print("⏳ Compiling PyTeal to TEAL...")
+    try:
+        approval_teal, clear_teal, metadata = get_teal(contract_path)
+    except ContractError:
         print("❌ Contract must have 'compile_contract()' function")
         return None
     
-    print("⏳ Compiling PyTeal to TEAL...")
-    approval_teal, clear_teal = contract_module.compile_contract()
+    if not approval_teal:
+        return None
     
     # Get schemas
-    global_schema = (0, 0)  # Default
-    local_schema = (0, 0)   # Default
-    
-    if hasattr(contract_module, 'get_global_schema'):
-        global_schema = contract_module.get_global_schema()
-    if hasattr(contract_module, 'get_local_schema'):
-        local_schema = contract_module.get_local_schema()
+    global_schema = metadata.get('global_schema', (0, 0))
+    local_schema = metadata.get('local_schema', (0, 0))
     
     print(f"   Global Schema: {global_schema[0]} uints, {global_schema[1]} byte slices")
     print(f"   Local Schema:  {local_schema[0]} uints, {local_schema[1]} byte slices")
     
-    # Connect to network
+    # Connect to network (algosdk is only loaded once it's needed)
     print("\n⏳ Connecting to Algorand TestNet...")
+    from utils.algod_client import get_algod_client
     client = get_algod_client()
     
     # Compile TEAL to bytecode
     print("⏳ Compiling TEAL to bytecode...")
-    approval_bytecode = compile_to_bytecode(client, approval_teal)
-    clear_bytecode = compile_to_bytecode(client, clear_teal)
+    # The two programs compile independently, so overlap the round-trips
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        approval_future = executor.submit(compile_to_bytecode, client, approval_teal)
+        clear_future = executor.submit(compile_to_bytecode, client, clear_teal)
+        approval_bytecode = approval_future.result()
+        clear_bytecode = clear_future.result()
     
     if not approval_bytecode or not clear_bytecode:
         return None
@@ -206,7 +209,8 @@ def deploy_contract(contract_path):
     
     # Check creator balance
     try:
-        account_info = client.account_info(creator_address)
+        # Only the balance is needed, so skip the asset/app lists
+        account_info = client.account_info(creator_address, exclude="all")
         balance = account_info.get('amount', 0)
         print(f"✓ Balance: {microalgos_to_algos(balance):.6f} ALGO")
         
@@ -291,10 +295,12 @@ def main():
         )
         
         if os.path.exists(contracts_dir):
-            contracts = [
-                f for f in os.listdir(contracts_dir)
-                if f.endswith('.py') and not f.startswith('__')
-            ]
+            with os.scandir(contracts_dir) as entries:
+                contracts = [
+                    e.name for e in entries
+                    if e.name.endswith('.py') and not e.name.startswith('__')
+                    and e.is_file()
+                ]
             
             for i, contract in enumerate(contracts, 1):
                 print(f"   {i}. {contract}")
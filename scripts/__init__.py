@@ -0,0 +1 @@
+"""Command-line scripts for working with Algorand accounts and transactions."""
@@ -10,14 +10,14 @@ Use this to:
 - Verify account exists on the network
 """
 
-from algosdk import account
 import sys
 import os
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m scripts.check_balance) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.algod_client import get_algod_client
 from utils.helpers import microalgos_to_algos, validate_address
 
 
@@ -28,10 +28,12 @@ def get_account_balance(client, address):
     This makes an API call to the Algod node to retrieve:
     - Current balance
     - Account status
-    - Number of transactions
     - Pending rewards
-    - Asset holdings
-    - Application state
+    - Number of assets and applications
+    
+    The full asset and application lists are excluded, since only their
+    counts are shown; for accounts holding many assets that keeps the
+    response small.
     
     Args:
         client: AlgodClient instance
@@ -41,7 +43,7 @@ def get_account_balance(client, address):
         dict: Account information or None if error
     """
     try:
-        account_info = client.account_info(address)
+        account_info = client.account_info(address, exclude="all")
         return account_info
     except Exception as e:
         print(f"\n❌ Error fetching account information:")
@@ -56,14 +58,13 @@ def get_account_balance(client, address):
         return None
 
 
-def display_detailed_balance(address, account_info, client):
+def display_detailed_balance(address, account_info):
     """
     Displays comprehensive account information in a formatted way.
     
     Args:
         address: Account address
         account_info: Account information dictionary
-        client: AlgodClient to fetch additional network info
     """
     print("\n" + "=" * 70)
     print("ACCOUNT BALANCE & STATUS")
@@ -100,9 +101,9 @@ def display_detailed_balance(address, account_info, client):
     print(f"   Round:          {account_info.get('round', 'N/A')}")
     
     # Asset and application information
-    num_assets = len(account_info.get('assets', []))
-    num_apps = len(account_info.get('apps-local-state', []))
-    num_created_apps = len(account_info.get('created-apps', []))
+    num_assets = account_info.get('total-assets-opted-in', 0)
+    num_apps = account_info.get('total-apps-opted-in', 0)
+    num_created_apps = account_info.get('total-created-apps', 0)
     
     if num_assets > 0 or num_apps > 0 or num_created_apps > 0:
         print(f"\n🔧 HOLDINGS & APPLICATIONS:")
@@ -113,14 +114,11 @@ def display_detailed_balance(address, account_info, client):
         if num_created_apps > 0:
             print(f"   Apps created:      {num_created_apps}")
     
-    # Network information
-    try:
-        status = client.status()
-        print(f"\n🌐 NETWORK INFO:")
-        print(f"   Current Round:  {status.get('last-round', 'N/A')}")
-        print(f"   Network:        TestNet")
-    except:
-        pass
+    # Network information (account_info is already as of the latest round,
+    # so no separate status call is needed)
+    print(f"\n🌐 NETWORK INFO:")
+    print(f"   Current Round:  {account_info.get('round', 'N/A')}")
+    print(f"   Network:        TestNet")
     
     # Helpful tips based on balance
     print(f"\n💡 TIPS:")
@@ -166,6 +164,7 @@ def main():
     
     # Create client and fetch balance
     print("\n⏳ Connecting to Algorand TestNet...")
+    from utils.algod_client import get_algod_client
     client = get_algod_client()
     
     print("⏳ Fetching account information...")
@@ -176,7 +175,7 @@ def main():
         return
     
     # Display the results
-    display_detailed_balance(address, account_info, client)
+    display_detailed_balance(address, account_info)
     
     print("\n✅ Balance check complete!")
     print("=" * 70 + "\n")
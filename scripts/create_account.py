@@ -10,14 +10,16 @@ SECURITY WARNING:
 - Anyone with your mnemonic has FULL control of your account
 """
 
-from algosdk import account, mnemonic
+import argparse
 import sys
 import os
 
-# Add parent directory to path so we can import from utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m scripts.create_account) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.helpers import print_account_info, microalgos_to_algos
+from utils.helpers import print_account_info, microalgos_to_algos, format_mnemonic_grid
 
 
 def create_new_account():
@@ -32,6 +34,10 @@ def create_new_account():
     Returns:
         tuple: (private_key, address, mnemonic)
     """
+    # Imported here so the banner shows up before the SDK (and its
+    # crypto dependencies) finish loading
+    from algosdk import account, mnemonic
+    
     # Generate a random private key
     # This is cryptographically secure random data
     private_key, address = account.generate_account()
@@ -43,6 +49,48 @@ def create_new_account():
     return private_key, address, account_mnemonic
 
 
+def create_n_accounts(n):
+    """
+    Generates several new Algorand accounts at once (e.g. for testing).
+    
+    Equivalent to calling account.generate_account() n times, but the
+    random seeds for all accounts are read in a single os.urandom() call
+    and each key pair is derived only once.
+    
+    Args:
+        n: Number of accounts to generate
+        
+    Returns:
+        list: (private_key, address) tuples, in the SDK's formats
+    """
+    from utils.mnemonic_fast import account_from_key
+    
+    seeds = os.urandom(32 * n)
+    return [account_from_key(seeds[offset:offset + 32]) for offset in range(0, 32 * n, 32)]
+
+
+def display_accounts_batch(accounts):
+    """
+    Lists several generated accounts with their mnemonics.
+    
+    Args:
+        accounts: (private_key, address) tuples from create_n_accounts()
+    """
+    from algosdk import mnemonic
+    
+    print("\n" + "=" * 70)
+    print(f"{len(accounts)} NEW ALGORAND ACCOUNTS CREATED")
+    print("=" * 70)
+    
+    for number, (private_key, address) in enumerate(accounts, 1):
+        print(f"\n[{number}] {address}")
+        print(f"    {mnemonic.from_private_key(private_key)}")
+    
+    print("\n⚠️  These mnemonics control the accounts above.")
+    print("   Use them for TestNet testing only, and don't keep them around.")
+    print("\n" + "=" * 70)
+
+
 def display_account_details(address, mnemonic_phrase):
     """
     Displays account information in a user-friendly format.
@@ -64,11 +112,7 @@ def display_account_details(address, mnemonic_phrase):
     print("-" * 70)
     
     # Display mnemonic in a formatted grid (easier to write down)
-    words = mnemonic_phrase.split()
-    for i in range(0, len(words), 5):
-        chunk = words[i:i+5]
-        formatted = "   " + "  ".join(f"{i+j+1:2d}. {word:12s}" for j, word in enumerate(chunk))
-        print(formatted)
+    print(format_mnemonic_grid(mnemonic_phrase))
     
     print("-" * 70)
     
@@ -116,11 +160,24 @@ def save_to_file_option(address, mnemonic_phrase):
         # Create filename from first 8 chars of address
         filename = os.path.join(accounts_dir, f"{address[:8]}.account")
         
-        with open(filename, 'w') as f:
-            f.write(f"Address: {address}\n")
-            f.write(f"Mnemonic: {mnemonic_phrase}\n")
-            f.write(f"\nWARNING: This file contains sensitive information!\n")
-            f.write(f"Only use for TestNet testing. Delete after use.\n")
+        contents = (
+            f"Address: {address}\n"
+            f"Mnemonic: {mnemonic_phrase}\n"
+            f"\nWARNING: This file contains sensitive information!\n"
+            f"Only use for TestNet testing. Delete after use.\n"
+        )
+        
+        # Readable by the owner only, and never overwrite an existing file
+        try:
+            fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            print(f"\n   ❌ File already exists: {filename}")
+            print("   Account not saved.")
+            return
+        
+        # One write for the whole file
+        with os.fdopen(fd, 'wb') as f:
+            f.write(contents.encode('utf-8'))
         
         print(f"\n   ✓ Account saved to: {filename}")
         print(f"   ⚠️  Remember to delete this file when done testing!")
@@ -129,13 +186,48 @@ def save_to_file_option(address, mnemonic_phrase):
         print("\n   ✓ Account not saved (good security practice!)")
 
 
+def _positive_int(value):
+    """argparse type for --count: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Create new Algorand accounts."
+    )
+    parser.add_argument(
+        "--count",
+        type=_positive_int,
+        default=1,
+        help="Number of accounts to create (default: 1). More than one "
+             "lists them all for testing, without the save option"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main execution function."""
+    args = parse_args()
+    
     print("\n🚀 ALGORAND ACCOUNT GENERATOR")
     print("=" * 70)
     print("This will create a new Algorand account on TestNet.")
     print("=" * 70)
     
+    if args.count > 1:
+        print(f"\n⏳ Generating {args.count} random accounts...")
+        display_accounts_batch(create_n_accounts(args.count))
+        print("\n✅ Account creation complete!")
+        print("=" * 70 + "\n")
+        return
+    
     # Generate the account
     print("\n⏳ Generating random account...")
     private_key, address, mnemonic_phrase = create_new_account()
@@ -8,54 +8,152 @@ The Indexer is a separate service that maintains a searchable database
 of all blockchain activity. It's much more powerful than querying the
 Algod node directly for historical data.
 
+Usage:
+    python scripts/indexer_search.py [ADDRESS ...] [--limit N] [--type TYPE] [--json]
+
 Use this to:
-- View transaction history for an address
+- View transaction history for one or several addresses
 - Search transactions by type
 - Analyze account activity
 - Build blockchain analytics
 """
 
+import argparse
 import sys
 import os
-from datetime import datetime
+from binascii import a2b_base64
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from time import localtime
+
+# Add parent directory to path when run as a file. Run as a module
+# (python -m scripts.indexer_search) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.indexer_client import (
+    get_indexer_client,
+    iter_transactions_by_address,
+    search_transactions_by_addresses
+)
+from utils.helpers import (
+    MICROALGOS_PER_ALGO,
+    microalgos_to_algos,
+    validate_address,
+    format_address,
+    write_json
+)
 
-from utils.indexer_client import get_indexer_client
-from utils.helpers import microalgos_to_algos, validate_address, format_address
+# Maximum results requested per indexer query
+SEARCH_PAGE_SIZE = 50
 
 
-def search_address_transactions(indexer, address, limit=10, tx_type=None):
+def search_address_transactions(indexer, address, limit=10, tx_type=None, min_round=None):
     """
     Searches for transactions involving a specific address.
     
+    Results are fetched in pages of at most SEARCH_PAGE_SIZE (see
+    iter_transactions_by_address), so each query stays small and bounded
+    instead of asking the indexer for everything at once (large queries
+    are the ones that time out on busy public indexers).
+    
     Args:
         indexer: IndexerClient instance
         address: Address to search for
         limit: Maximum number of results (default: 10)
         tx_type: Optional transaction type filter (pay, axfer, acfg, afrz, appl)
+        min_round: Optional first round to search from, to skip old history
         
     Returns:
-        dict: Search results containing transactions
+        dict: {'transactions': [...]}, newest first, or None on error
+        
+    Raises:
+        ValueError: If limit is less than 1
     """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    
     try:
-        # Build search parameters
-        search_params = {
-            'limit': limit
-        }
-        
-        # Add transaction type filter if specified
-        if tx_type:
-            search_params['txn_type'] = tx_type
-        
-        # Execute search
-        response = indexer.search_transactions_by_address(address, **search_params)
-        return response
+        pages = iter_transactions_by_address(
+            indexer,
+            address,
+            page_size=min(limit, SEARCH_PAGE_SIZE),
+            txn_type=tx_type,
+            min_round=min_round
+        )
+        return {'transactions': list(islice(pages, limit))}
         
     except Exception as e:
-        print(f"\n❌ Error searching transactions: {str(e)}")
+        # To stderr, so it doesn't end up in --json output
+        print(f"\n❌ Error searching transactions: {str(e)}", file=sys.stderr)
+        return None
+
+
+def _format_timestamp(timestamp):
+    """Formats a Unix timestamp as local 'YYYY-MM-DD HH:MM:SS'."""
+    # Plain % formatting of the struct_time fields; same output as
+    # strftime('%Y-%m-%d %H:%M:%S') without parsing a format each call
+    return "%04d-%02d-%02d %02d:%02d:%02d" % localtime(timestamp)[:6]
+
+
+def _decode_note(note):
+    """Decodes a base64 note as UTF-8 text, or returns None."""
+    if not note or not isinstance(note, str):
         return None
+    try:
+        raw = a2b_base64(note)
+    except ValueError:
+        # Not valid base64 (binascii.Error)
+        return None
+    
+    # Binary notes are common (app and protocol payloads); decoding with
+    # replacement characters detects them without raising and catching
+    # a UnicodeDecodeError for every such row
+    text = raw.decode('utf-8', 'replace')
+    return None if '\ufffd' in text else text
+
+
+def _format_payment(txn):
+    """Detail lines for a payment transaction."""
+    payment_txn = txn.get('payment-transaction', {})
+    sender = txn.get('sender', 'Unknown')
+    receiver = payment_txn.get('receiver', 'Unknown')
+    amount = payment_txn.get('amount', 0)
+    
+    # Divided inline: this runs once per row
+    return (
+        f"       From:  {format_address(sender)}\n"
+        f"       To:    {format_address(receiver)}\n"
+        f"       Amt:   {amount / MICROALGOS_PER_ALGO:.6f} ALGO"
+    )
+
+
+def _format_asset_transfer(txn):
+    """Detail lines for an asset transfer."""
+    asset_txn = txn.get('asset-transfer-transaction', {})
+    asset_id = asset_txn.get('asset-id', 0)
+    amount = asset_txn.get('amount', 0)
+    
+    return (
+        f"       Asset: {asset_id}\n"
+        f"       Amt:   {amount}"
+    )
+
+
+def _format_app_call(txn):
+    """Detail lines for an application call."""
+    app_txn = txn.get('application-transaction', {})
+    app_id = app_txn.get('application-id', 0)
+    
+    return f"       App:   {app_id}"
+
+
+# Transaction type -> detail formatter; other types have no details
+_DETAIL_FORMATTERS = {
+    'pay': _format_payment,
+    'axfer': _format_asset_transfer,
+    'appl': _format_app_call
+}
 
 
 def display_transaction_list(transactions):
@@ -80,10 +178,7 @@ def display_transaction_list(transactions):
         
         # Get timestamp if available
         timestamp = txn.get('round-time', 0)
-        if timestamp:
-            time_str = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
-        else:
-            time_str = 'Unknown time'
+        time_str = _format_timestamp(timestamp) if timestamp else 'Unknown time'
         
         print(f"\n   [{i}] {time_str}")
         print(f"       Type:  {tx_type.upper()}")
@@ -91,41 +186,14 @@ def display_transaction_list(transactions):
         print(f"       TX ID: {txid[:16]}...")
         
         # Display details based on transaction type
-        if tx_type == 'pay':
-            # Payment transaction
-            payment_txn = txn.get('payment-transaction', {})
-            sender = txn.get('sender', 'Unknown')
-            receiver = payment_txn.get('receiver', 'Unknown')
-            amount = payment_txn.get('amount', 0)
-            
-            print(f"       From:  {format_address(sender)}")
-            print(f"       To:    {format_address(receiver)}")
-            print(f"       Amt:   {microalgos_to_algos(amount):.6f} ALGO")
-        
-        elif tx_type == 'axfer':
-            # Asset transfer
-            asset_txn = txn.get('asset-transfer-transaction', {})
-            asset_id = asset_txn.get('asset-id', 0)
-            amount = asset_txn.get('amount', 0)
-            print(f"       Asset: {asset_id}")
-            print(f"       Amt:   {amount}")
-        
-        elif tx_type == 'appl':
-            # Application call
-            app_txn = txn.get('application-transaction', {})
-            app_id = app_txn.get('application-id', 0)
-            print(f"       App:   {app_id}")
-        
-        # Show note if present
-        note = txn.get('note', None)
-        if note:
-            try:
-                # Try to decode base64 note
-                import base64
-                note_text = base64.b64decode(note).decode('utf-8')
-                print(f"       Note:  {note_text}")
-            except:
-                pass
+        format_details = _DETAIL_FORMATTERS.get(tx_type)
+        if format_details:
+            print(format_details(txn))
+        
+        # Show note if present and readable
+        note_text = _decode_note(txn.get('note'))
+        if note_text:
+            print(f"       Note:  {note_text}")
     
     print("\n   " + "=" * 66)
 
@@ -170,39 +238,144 @@ def display_account_summary(indexer, address):
         print(f"\n   ℹ️  Could not fetch account summary: {str(e)}")
 
 
+def _positive_int(value):
+    """argparse type for --limit: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Search transaction history using the Algorand Indexer."
+    )
+    parser.add_argument(
+        "addresses",
+        nargs="*",
+        metavar="address",
+        help="Address(es) to search for; several are searched concurrently"
+    )
+    parser.add_argument("--limit", type=_positive_int, help="Number of recent transactions (default: 10)")
+    parser.add_argument("--type", dest="tx_type", help="Transaction type filter (pay, axfer, appl, ...)")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the indexer's search results as JSON, without prompts"
+    )
+    return parser.parse_args()
+
+
+def search_many(indexer, addresses, limit, tx_type):
+    """
+    Searches several addresses concurrently.
+    
+    Args:
+        indexer: IndexerClient instance
+        addresses: Addresses to search for
+        limit: Maximum number of results per address
+        tx_type: Optional transaction type filter
+        
+    Returns:
+        dict: Address -> {'transactions': [...]}, or None if that
+        address's search failed
+    """
+    results = search_transactions_by_addresses(
+        indexer,
+        addresses,
+        limit,
+        page_size=min(limit, SEARCH_PAGE_SIZE),
+        txn_type=tx_type
+    )
+    return {
+        address: None if transactions is None else {'transactions': transactions}
+        for address, transactions in results.items()
+    }
+
+
+def search_as_json(addresses, limit, tx_type):
+    """
+    Non-interactive mode: prints the search results as JSON.
+    
+    A single address prints its results; several print an object keyed
+    by address (null for an address whose search failed).
+    
+    Args:
+        addresses: Addresses to search for
+        limit: Maximum number of results per address
+        tx_type: Optional transaction type filter
+        
+    Returns:
+        int: Exit status
+    """
+    if not addresses or not all(validate_address(a) for a in addresses):
+        print("Error: valid Algorand addresses are required", file=sys.stderr)
+        return 2
+    
+    indexer = get_indexer_client()
+    if len(addresses) == 1:
+        results = search_address_transactions(indexer, addresses[0], limit, tx_type)
+        failed = results is None
+    else:
+        results = search_many(indexer, addresses, limit, tx_type)
+        failed = None in results.values()
+    
+    if results is not None:
+        write_json(results)
+    return 1 if failed else 0
+
+
 def main():
     """Main execution function."""
+    args = parse_args()
+    
+    if args.json:
+        sys.exit(search_as_json(args.addresses, args.limit or 10, args.tx_type))
+    
     print("\n🔎 ALGORAND INDEXER SEARCH")
     print("=" * 70)
     print("Search transaction history using the Algorand Indexer.")
     print("=" * 70)
     
-    # Get address from command line or user input
-    if len(sys.argv) > 1:
-        address = sys.argv[1]
-    else:
+    # Get address(es) from command line or user input
+    addresses = args.addresses
+    if not addresses:
         print("\nEnter an Algorand address to search:")
-        address = input("Address: ").strip()
+        addresses = input("Address: ").split()
     
-    if not address:
+    if not addresses:
         print("\n❌ No address provided.")
         return
     
-    # Validate address
-    if not validate_address(address):
-        print(f"\n❌ Error: Invalid Algorand address format")
+    # Validate addresses
+    invalid = [a for a in addresses if not validate_address(a)]
+    if invalid:
+        print(f"\n❌ Error: Invalid Algorand address format: {invalid[0]}")
         return
     
-    print(f"\nSearching for: {address[:8]}...{address[-8:]}")
+    address = addresses[0]
+    if len(addresses) == 1:
+        print(f"\nSearching for: {address[:8]}...{address[-8:]}")
+    else:
+        print(f"\nSearching {len(addresses)} addresses")
     
-    # Get search parameters
-    print("\nHow many recent transactions to show? (default: 10)")
-    limit_input = input("Limit: ").strip()
-    limit = int(limit_input) if limit_input.isdigit() else 10
+    # Get search parameters (prompting for any not given as options)
+    limit = args.limit
+    if limit is None:
+        print("\nHow many recent transactions to show? (default: 10)")
+        limit_input = input("Limit: ").strip()
+        # Anything but a positive number falls back to the default
+        limit = int(limit_input) if limit_input.isdigit() and int(limit_input) > 0 else 10
     
-    print("\nFilter by transaction type? (leave empty for all)")
-    print("Options: pay (payments), axfer (assets), appl (applications)")
-    tx_type = input("Type: ").strip().lower() or None
+    tx_type = args.tx_type
+    if tx_type is None:
+        print("\nFilter by transaction type? (leave empty for all)")
+        print("Options: pay (payments), axfer (assets), appl (applications)")
+        tx_type = input("Type: ").strip().lower() or None
     
     print("\n" + "=" * 70)
     
@@ -210,13 +383,32 @@ def main():
     print("\n⏳ Connecting to Algorand Indexer...")
     indexer = get_indexer_client()
     
-    # Display account summary
-    print("⏳ Fetching account summary...")
-    display_account_summary(indexer, address)
+    if len(addresses) > 1:
+        print(f"⏳ Searching for {limit} recent transactions per address...")
+        for address, results in search_many(indexer, addresses, limit, tx_type).items():
+            print(f"\n📬 {address}")
+            if results is None:
+                print("\n❌ Search failed.")
+            else:
+                display_transaction_list(results['transactions'])
+        print("\n✅ Search complete!")
+        print("=" * 70 + "\n")
+        return
     
-    # Search transactions
-    print(f"\n⏳ Searching for {limit} recent transactions...")
-    results = search_address_transactions(indexer, address, limit, tx_type)
+    # The transaction search doesn't depend on the summary, so run it
+    # in the background while the summary is fetched and displayed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        search_future = executor.submit(
+            search_address_transactions, indexer, address, limit, tx_type
+        )
+        
+        # Display account summary
+        print("⏳ Fetching account summary...")
+        display_account_summary(indexer, address)
+        
+        # Search transactions
+        print(f"\n⏳ Searching for {limit} recent transactions...")
+        results = search_future.result()
     
     if not results:
         print("\n❌ Search failed.")
@@ -9,49 +9,41 @@ Use this when you want to:
 - Verify that a mnemonic is correct
 """
 
-from algosdk import account, mnemonic
+import argparse
 import sys
 import os
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m scripts.recover_account) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.algod_client import get_algod_client
-from utils.helpers import print_account_info, microalgos_to_algos
+from utils.helpers import (
+    print_account_info,
+    microalgos_to_algos,
+    format_mnemonic_grid,
+    write_json
+)
 
 
-def recover_account_from_mnemonic(mnemonic_phrase):
+def recover_account_from_key(key):
     """
-    Recovers an account from a 25-word mnemonic phrase.
+    Recovers an account from the key its mnemonic encodes.
     
     The mnemonic is a human-readable representation of the private key.
     It can be used to regenerate the exact same private key and address.
     
     Args:
-        mnemonic_phrase: String containing 25 words separated by spaces
+        key: 32-byte key decoded by get_mnemonic_input()
         
     Returns:
-        tuple: (private_key, address) or (None, None) if invalid
+        tuple: (private_key, address)
     """
-    try:
-        # Validate and convert mnemonic to private key
-        # This will raise an exception if the mnemonic is invalid
-        private_key = mnemonic.to_private_key(mnemonic_phrase)
-        
-        # Derive the public address from the private key
-        address = account.address_from_private_key(private_key)
-        
-        return private_key, address
-        
-    except Exception as e:
-        print(f"\n❌ Error: Invalid mnemonic phrase")
-        print(f"   Details: {str(e)}")
-        print("\n   Common issues:")
-        print("   • Make sure you have exactly 25 words")
-        print("   • Check for typos in the words")
-        print("   • Ensure words are separated by single spaces")
-        print("   • All words should be lowercase")
-        return None, None
+    from utils.mnemonic_fast import account_from_key
+    
+    # Derive the private key and public address from the already
+    # validated key; this can't fail
+    return account_from_key(key)
 
 
 def verify_account_connection(address):
@@ -69,9 +61,12 @@ def verify_account_connection(address):
     Returns:
         dict: Account information or None if error
     """
+    from utils.algod_client import get_algod_client
+    
     try:
         client = get_algod_client()
-        account_info = client.account_info(address)
+        # Only the header fields are displayed, so skip the asset/app lists
+        account_info = client.account_info(address, exclude="all")
         return account_info
     except Exception as e:
         print(f"\n⚠️  Warning: Could not fetch account info from network")
@@ -101,11 +96,7 @@ def display_recovery_result(address, mnemonic_phrase, account_info):
     
     print("\n🔑 MNEMONIC PHRASE:")
     print("-" * 70)
-    words = mnemonic_phrase.split()
-    for i in range(0, len(words), 5):
-        chunk = words[i:i+5]
-        formatted = "   " + "  ".join(f"{i+j+1:2d}. {word:12s}" for j, word in enumerate(chunk))
-        print(formatted)
+    print(format_mnemonic_grid(mnemonic_phrase))
     print("-" * 70)
     
     # Display network account info if available
@@ -137,15 +128,59 @@ def display_recovery_result(address, mnemonic_phrase, account_info):
     print("\n" + "=" * 70)
 
 
-def get_mnemonic_input():
+def read_mnemonic_file(path):
+    """
+    Reads a mnemonic phrase from a file ("-" for standard input).
+    
+    Args:
+        path: Path to a file containing the mnemonic
+        
+    Returns:
+        str: The mnemonic phrase
+    """
+    if path == "-":
+        return sys.stdin.read().strip()
+    with open(path, encoding='utf-8') as f:
+        return f.read().strip()
+
+
+def get_mnemonic_input(mnemonic_phrase=None):
     """
     Prompts user to input their mnemonic phrase.
     
     Provides helpful instructions and validation.
     
+    Args:
+        mnemonic_phrase: Phrase read from --mnemonic-file; prompts if None
+        
     Returns:
-        str: The mnemonic phrase
+        tuple: (mnemonic_phrase, key) with the 32-byte key the phrase
+        encodes, or (None, None) if it isn't valid
     """
+    if mnemonic_phrase is None:
+        mnemonic_phrase = _prompt_mnemonic()
+    
+    # Check the words and checksum locally, so a mistyped phrase is
+    # reported precisely and never reaches the network. The decoded key
+    # is kept so the account is derived without decoding again.
+    # Imported here: loading the SDK and its crypto dependencies is the
+    # bulk of this script's startup time, and it isn't needed until now
+    from utils.mnemonic_fast import mnemonic_to_key
+    
+    try:
+        key = mnemonic_to_key(mnemonic_phrase)
+    except ValueError as e:
+        print(f"\n❌ Invalid mnemonic: {e}")
+        print("\n   Common issues:")
+        print("   • Make sure you have exactly 25 words")
+        print("   • Check for typos in the words")
+        print("   • Ensure words are separated by single spaces")
+        return None, None
+    
+    return mnemonic_phrase, key
+
+
+def _prompt_mnemonic():
     print("\n📝 ENTER YOUR 25-WORD MNEMONIC PHRASE")
     print("=" * 70)
     print("You can enter it in several ways:")
@@ -156,40 +191,85 @@ def get_mnemonic_input():
     print("  word1 word2 word3 ... word24 word25")
     print("=" * 70)
     
-    mnemonic_phrase = input("\nEnter mnemonic: ").strip()
+    return input("\nEnter mnemonic: ").strip()
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Recover an Algorand account from its mnemonic phrase."
+    )
+    parser.add_argument(
+        "--mnemonic-file",
+        help="Read the mnemonic from this file instead of prompting (- for stdin)"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the address and account info as JSON, without prompts "
+             "(reads the mnemonic from stdin unless --mnemonic-file is given)"
+    )
+    return parser.parse_args()
+
+
+def recover_as_json(mnemonic_phrase):
+    """
+    Non-interactive mode: prints the recovered address and its account
+    info as JSON. The private key and mnemonic are never printed.
     
-    # Basic validation
-    word_count = len(mnemonic_phrase.split())
-    if word_count != 25:
-        print(f"\n⚠️  Warning: You entered {word_count} words, but a valid mnemonic has 25 words.")
-        confirm = input("Continue anyway? (yes/no): ").strip().lower()
-        if confirm != 'yes':
-            return None
+    Args:
+        mnemonic_phrase: The mnemonic phrase
+        
+    Returns:
+        int: Exit status
+    """
+    from utils.mnemonic_fast import recover_from_mnemonic
+    from utils.algod_client import get_algod_client
+    
+    try:
+        _, address = recover_from_mnemonic(mnemonic_phrase)
+    except ValueError as e:
+        print(f"Error: invalid mnemonic: {e}", file=sys.stderr)
+        return 1
     
-    return mnemonic_phrase
+    try:
+        account_info = get_algod_client().account_info(address, exclude="all")
+    except Exception:
+        # Not funded yet, or the node is unreachable
+        account_info = None
+    
+    write_json({"address": address, "account": account_info})
+    return 0
 
 
 def main():
     """Main execution function."""
+    args = parse_args()
+    
+    mnemonic_phrase = None
+    if args.mnemonic_file:
+        mnemonic_phrase = read_mnemonic_file(args.mnemonic_file)
+    
+    if args.json:
+        if mnemonic_phrase is None:
+            mnemonic_phrase = sys.stdin.read().strip()
+        sys.exit(recover_as_json(mnemonic_phrase))
+    
     print("\n🔓 ALGORAND ACCOUNT RECOVERY")
     print("=" * 70)
     print("This script recovers an Algorand account from its mnemonic phrase.")
     print("=" * 70)
     
-    # Get mnemonic from user
-    mnemonic_phrase = get_mnemonic_input()
+    # Get mnemonic from the file or the user
+    mnemonic_phrase, key = get_mnemonic_input(mnemonic_phrase)
     
     if not mnemonic_phrase:
-        print("\n❌ Recovery cancelled.")
+        print("\n❌ Account recovery failed. Please check your mnemonic and try again.")
         return
     
-    # Attempt recovery
+    # Derive the account from the key decoded above
     print("\n⏳ Recovering account from mnemonic...")
-    private_key, address = recover_account_from_mnemonic(mnemonic_phrase)
-    
-    if not address:
-        print("\n❌ Account recovery failed. Please check your mnemonic and try again.")
-        return
+    private_key, address = recover_account_from_key(key)
     
     # Verify connection to network
     print("\n⏳ Verifying account on TestNet...")
@@ -4,20 +4,33 @@ Send ALGO Transaction
 This script demonstrates how to create, sign, and send a payment transaction
 on the Algorand TestNet.
 
+Usage:
+    python scripts/send_algo.py                  # one payment, interactive
+    python scripts/send_algo.py --batch FILE     # many payments from a file
+    python scripts/send_algo.py --batch FILE --independent
+
+A batch file has one "receiver,amount_in_algo" pair per line; blank
+lines and lines starting with # are ignored.
+
 This is one of the most fundamental operations on Algorand:
 - Transferring ALGO from one account to another
 - Understanding transaction fees
 - Waiting for confirmation
 """
 
-from algosdk import transaction, mnemonic, account
+from algosdk import constants, transaction, account
+import argparse
 import sys
 import os
+from binascii import a2b_base64, b2a_base64
+from decimal import InvalidOperation
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m scripts.send_algo) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.algod_client import get_algod_client
+from utils.algod_client import get_algod_client, get_suggested_params_cached
 from utils.helpers import (
     algos_to_microalgos, 
     microalgos_to_algos,
@@ -25,6 +38,11 @@ from utils.helpers import (
     wait_for_confirmation,
     print_transaction_summary
 )
+from utils.mnemonic_fast import recover_from_mnemonic
+
+# Concurrent submissions for send_transactions_concurrently; stays well
+# within the shared HTTP session's connection pool
+SEND_WORKERS = 8
 
 
 def get_sender_private_key():
@@ -43,11 +61,11 @@ def get_sender_private_key():
     if not mnemonic_phrase:
         return None, None
     
+    # Splits the phrase once, checks the word count before decoding
+    # anything, and derives the key pair a single time
     try:
-        private_key = mnemonic.to_private_key(mnemonic_phrase)
-        address = account.address_from_private_key(private_key)
-        return private_key, address
-    except Exception as e:
+        return recover_from_mnemonic(mnemonic_phrase)
+    except ValueError as e:
         print(f"\n❌ Error: Invalid mnemonic - {str(e)}")
         return None, None
 
@@ -91,7 +109,8 @@ def get_amount_to_send():
             print(f"\n❌ Error: Amount must be greater than zero")
             return None
         
-        amount_microalgos = algos_to_microalgos(amount_algos)
+        # Convert from the typed text so no float rounding creeps in
+        amount_microalgos = algos_to_microalgos(amount_input)
         
         print(f"\n   Converting: {amount_algos} ALGO = {amount_microalgos:,} microAlgos")
         return amount_microalgos
@@ -148,24 +167,28 @@ def verify_sender_balance(client, sender, amount, fee):
         
         total_needed = amount + fee + min_balance
         
-        print(f"\n💳 BALANCE CHECK")
-        print("-" * 70)
-        print(f"Current balance:     {microalgos_to_algos(balance):>10.6f} ALGO")
-        print(f"Amount to send:      {microalgos_to_algos(amount):>10.6f} ALGO")
-        print(f"Transaction fee:     {microalgos_to_algos(fee):>10.6f} ALGO")
-        print(f"Min balance needed:  {microalgos_to_algos(min_balance):>10.6f} ALGO")
-        print(f"{'-' * 70}")
-        print(f"Total required:      {microalgos_to_algos(total_needed):>10.6f} ALGO")
+        # Collect the report and write it out at once
+        lines = [
+            f"\n💳 BALANCE CHECK",
+            "-" * 70,
+            f"Current balance:     {microalgos_to_algos(balance):>10.6f} ALGO",
+            f"Amount to send:      {microalgos_to_algos(amount):>10.6f} ALGO",
+            f"Transaction fee:     {microalgos_to_algos(fee):>10.6f} ALGO",
+            f"Min balance needed:  {microalgos_to_algos(min_balance):>10.6f} ALGO",
+            "-" * 70,
+            f"Total required:      {microalgos_to_algos(total_needed):>10.6f} ALGO"
+        ]
         
-        if balance < total_needed:
-            print(f"\n❌ Insufficient balance!")
-            print(f"   You need {microalgos_to_algos(total_needed - balance):.6f} more ALGO")
-            return False
+        sufficient = balance >= total_needed
+        if sufficient:
+            lines.append(f"Remaining after:     {microalgos_to_algos(balance - total_needed):>10.6f} ALGO")
+            lines.append(f"\n✓ Sufficient balance available")
+        else:
+            lines.append(f"\n❌ Insufficient balance!")
+            lines.append(f"   You need {microalgos_to_algos(total_needed - balance):.6f} more ALGO")
         
-        remaining = balance - total_needed
-        print(f"Remaining after:     {microalgos_to_algos(remaining):>10.6f} ALGO")
-        print(f"\n✓ Sufficient balance available")
-        return True
+        sys.stdout.write("\n".join(lines) + "\n")
+        return sufficient
         
     except Exception as e:
         print(f"\n❌ Error checking balance: {str(e)}")
@@ -217,6 +240,39 @@ def sign_transaction(txn, private_key):
     return signed_txn
 
 
+def sign_transactions(txns, private_key):
+    """
+    Signs many transactions with the same private key.
+    
+    txn.sign() decodes the key and derives the signer's address from it
+    (twice) for every transaction. Here that is done once, and each
+    transaction only costs the Ed25519 signature itself. The result is
+    the same as calling sign_transaction() on each one.
+    
+    Args:
+        txns: List of Transaction objects
+        private_key: Signer's private key
+        
+    Returns:
+        list: SignedTransaction objects, in the order of `txns`
+    """
+    # Imported here: only needed for bulk sends
+    from nacl.signing import SigningKey
+    
+    signing_key = SigningKey(a2b_base64(private_key)[:constants.key_len_bytes])
+    signer = account.address_from_private_key(private_key)
+    
+    signed_txns = []
+    for txn in txns:
+        signature = signing_key.sign(txn.bytes_to_sign()).signature
+        # Signing for another account (rekeyed sender) records the signer
+        auth_addr = None if txn.sender == signer else signer
+        signed_txns.append(transaction.SignedTransaction(
+            txn, b2a_base64(signature, newline=False).decode(), auth_addr
+        ))
+    return signed_txns
+
+
 def send_transaction(client, signed_txn):
     """
     Submits a signed transaction to the network.
@@ -236,8 +292,286 @@ def send_transaction(client, signed_txn):
         return None
 
 
+def confirmation_status(client, txid):
+    """
+    Waits for a transaction and reports how it ended.
+    
+    Args:
+        client: AlgodClient instance
+        txid: Transaction ID to wait for
+        
+    Returns:
+        dict: {'status': 'confirmed', 'round': N}, or {'status':
+        'rejected', 'error': ...} if the node dropped it, or
+        {'status': 'timed out'}
+    """
+    confirmed_txn = wait_for_confirmation(client, txid)
+    if confirmed_txn:
+        return {'status': 'confirmed', 'round': confirmed_txn.get('confirmed-round')}
+    
+    # wait_for_confirmation returns None for both; only a rejected
+    # transaction carries a pool error
+    try:
+        pool_error = client.pending_transaction_info(txid).get('pool-error')
+    except Exception:
+        pool_error = None
+    if pool_error:
+        return {'status': 'rejected', 'error': pool_error}
+    return {'status': 'timed out'}
+
+
+def send_algo_batch(client, sender, private_key, payments, params=None):
+    """
+    Sends many payments from one account as atomic transaction groups.
+    
+    Payments are split into groups of up to 16 (the protocol's group
+    size limit). Each group is submitted with a single send_transactions
+    call instead of one round-trip per payment. Once all groups are
+    submitted, each one is waited for; the first wait covers the block
+    time, so later groups usually need a single status check.
+    
+    All payments in a group succeed or fail together. If a group fails
+    to send, the groups after it are not sent, but the groups already
+    submitted are still waited for and reported.
+    
+    Args:
+        client: AlgodClient instance
+        sender: Sender address
+        private_key: Sender's private key
+        payments: List of (receiver, amount_in_microalgos) pairs
+        params: Suggested transaction parameters (fetched if omitted)
+    
+    Returns:
+        list: One dict per group sent or attempted, in order, with the
+        group's 'txids' plus its confirmation_status() fields, or
+        {'status': 'failed to send', 'error': ...} for the group that
+        could not be submitted
+    """
+    if params is None:
+        params = get_suggested_params_cached(client)
+    
+    groups = []
+    for start in range(0, len(payments), constants.TX_GROUP_LIMIT):
+        txns = [
+            transaction.PaymentTxn(sender=sender, sp=params, receiver=receiver, amt=amount)
+            for receiver, amount in payments[start:start + constants.TX_GROUP_LIMIT]
+        ]
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        signed_txns = sign_transactions(txns, private_key)
+        txids = [signed_txn.get_txid() for signed_txn in signed_txns]
+        
+        try:
+            client.send_transactions(signed_txns)
+        except Exception as e:
+            groups.append({'txids': txids, 'status': 'failed to send', 'error': str(e)})
+            break
+        groups.append({'txids': txids})
+    
+    # A group is confirmed atomically, so its first transaction speaks
+    # for all of them
+    for group in groups:
+        if 'status' not in group:
+            group.update(confirmation_status(client, group['txids'][0]))
+    return groups
+
+
+def send_transactions_concurrently(client, signed_txns, max_workers=SEND_WORKERS):
+    """
+    Submits independent signed transactions in parallel.
+    
+    Algorand transactions have no nonce, so independent transactions
+    can be submitted in any order. All submissions go out at once over
+    the pooled HTTP session and then land in the same (or next) block,
+    so waiting costs about one block in total instead of one per
+    transaction.
+    
+    Unlike a group, each transaction succeeds or fails on its own.
+    
+    Args:
+        client: AlgodClient instance
+        signed_txns: List of signed transactions (not grouped)
+        max_workers: Maximum number of concurrent submissions (default: 8)
+    
+    Returns:
+        list: One dict per transaction, in the order of `signed_txns`,
+        with its 'txid' plus its confirmation_status() fields, or
+        {'status': 'failed to send', 'error': ...}
+    """
+    # Imported here: only needed for bulk sends
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def submit(signed_txn):
+        result = {'txid': signed_txn.get_txid()}
+        try:
+            client.send_transaction(signed_txn)
+        except Exception as e:
+            result.update(status='failed to send', error=str(e))
+        return result
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(submit, signed_txns))
+    
+    # The first wait covers the block time; transactions already
+    # confirmed by then return after a single status check
+    for result in results:
+        if 'status' not in result:
+            result.update(confirmation_status(client, result['txid']))
+    return results
+
+
+def read_payments(path):
+    """
+    Reads a batch of payments from a file.
+    
+    Args:
+        path: File with one "receiver,amount_in_algo" pair per line
+        
+    Returns:
+        list: (receiver, amount_in_microalgos) pairs
+        
+    Raises:
+        ValueError: If a line is malformed, or the file has no payments
+    """
+    payments = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            receiver, _, amount_text = (part.strip() for part in line.partition(','))
+            if not validate_address(receiver):
+                raise ValueError(f"line {line_number}: invalid receiver address")
+            # Malformed ("abc"), infinite and NaN amounts all count as invalid
+            try:
+                amount = algos_to_microalgos(amount_text)
+            except (InvalidOperation, ValueError, OverflowError):
+                amount = 0
+            # Amounts are uint64 microAlgos on chain
+            if not 0 < amount < 2 ** 64:
+                raise ValueError(f"line {line_number}: invalid amount {amount_text!r}")
+            payments.append((receiver, amount))
+    
+    if not payments:
+        raise ValueError("no payments found")
+    return payments
+
+
+def print_batch_results(results):
+    """
+    Prints the outcome of each group or transaction of a batch.
+    
+    Args:
+        results: Results from send_algo_batch (per group) or
+            send_transactions_concurrently (per transaction)
+    """
+    print("\n📋 BATCH RESULTS")
+    print("=" * 70)
+    for number, result in enumerate(results, 1):
+        status = result['status']
+        if status == 'confirmed':
+            status += f" in round {result['round']}"
+        elif 'error' in result:
+            status += f": {result['error']}"
+        
+        icon = "✓" if result['status'] == 'confirmed' else "❌"
+        if 'txids' in result:
+            print(f"\n{icon} Group {number} ({len(result['txids'])} payment(s)) - {status}")
+            for txid in result['txids']:
+                print(f"   {txid}")
+        else:
+            print(f"\n{icon} Payment {number} - {status}")
+            print(f"   {result['txid']}")
+    print("\n" + "=" * 70)
+
+
+def run_batch(path, independent=False):
+    """
+    Sends the payments listed in a batch file.
+    
+    Args:
+        path: Batch file path
+        independent: Send each payment as its own transaction, so one
+            failing doesn't take the others with it, instead of as
+            atomic groups
+        
+    Returns:
+        int: Exit status
+    """
+    print("\n💸 SEND ALGO BATCH")
+    print("=" * 70)
+    
+    try:
+        payments = read_payments(path)
+    except (OSError, ValueError) as e:
+        print(f"\n❌ Error reading {path}: {e}")
+        return 2
+    
+    sender_private_key, sender_address = get_sender_private_key()
+    if not sender_address:
+        print("\n❌ Batch cancelled.")
+        return 1
+    
+    print("\n⏳ Connecting to Algorand TestNet...")
+    client = get_algod_client()
+    params = get_suggested_params_cached(client)
+    
+    total = sum(amount for _, amount in payments)
+    fees = max(params.fee, params.min_fee or constants.MIN_TXN_FEE) * len(payments)
+    if not verify_sender_balance(client, sender_address, total, fees):
+        print("\n❌ Batch cancelled due to insufficient balance.")
+        return 1
+    
+    print(f"\n⚠️  Send {len(payments)} payment(s) totalling "
+          f"{microalgos_to_algos(total):.6f} ALGO from {sender_address}?")
+    confirm = input("Proceed? (yes/no): ").strip().lower()
+    if confirm != 'yes':
+        print("\n❌ Batch cancelled by user.")
+        return 1
+    
+    if independent:
+        print("\n⏳ Sending transactions...")
+        txns = [
+            create_payment_transaction(sender_address, receiver, amount, None, params)
+            for receiver, amount in payments
+        ]
+        signed_txns = sign_transactions(txns, sender_private_key)
+        results = send_transactions_concurrently(client, signed_txns)
+    else:
+        print("\n⏳ Sending transaction groups...")
+        results = send_algo_batch(client, sender_address, sender_private_key, payments, params)
+    print_batch_results(results)
+    
+    # A failed group send ends the batch, so that group is the last result
+    return 0 if all(group['status'] == 'confirmed' for group in results) else 1
+
+
+def parse_args():
+    """Parses the command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Send ALGO on the Algorand TestNet."
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help='Send the payments listed in FILE ("receiver,amount_in_algo" per line)'
+    )
+    parser.add_argument(
+        "--independent",
+        action="store_true",
+        help="With --batch: send each payment as its own transaction, in "
+             "parallel, instead of in atomic groups of 16"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main execution function."""
+    args = parse_args()
+    if args.batch:
+        sys.exit(run_batch(args.batch, args.independent))
+    
     print("\n💸 SEND ALGO TRANSACTION")
     print("=" * 70)
     print("This script will help you send ALGO from one account to another.")
@@ -276,7 +610,7 @@ def main():
     # Step 5: Connect to network and get parameters
     print("\n⏳ Connecting to Algorand TestNet...")
     client = get_algod_client()
-    params = client.suggested_params()
+    params = get_suggested_params_cached(client)
     
     # Step 6: Verify balance
     if not verify_sender_balance(client, sender_address, amount, params.fee):
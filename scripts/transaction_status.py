@@ -4,6 +4,10 @@ Transaction Status Checker
 This script allows you to check the status of an Algorand transaction
 using its transaction ID.
 
+Usage:
+    python scripts/transaction_status.py [TXID ...]
+    python scripts/transaction_status.py --file txids.txt
+
 Use this to:
 - Verify if a transaction was confirmed
 - Get detailed transaction information
@@ -11,17 +15,58 @@ Use this to:
 - View transaction parameters
 """
 
+from algosdk.error import AlgodHTTPError
 import sys
 import os
+from binascii import a2b_base64
+from collections import OrderedDict
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add parent directory to path when run as a file. Run as a module
+# (python -m scripts.transaction_status) the project root already is.
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.algod_client import get_algod_client
 from utils.helpers import microalgos_to_algos, format_address
 
 
-def get_transaction_status(client, txid):
+# Round -> block timestamp. Blocks are immutable, so entries never go
+# stale; the oldest are dropped once the cache is full.
+BLOCK_TS_CACHE_MAX = 1024
+_block_ts_cache = OrderedDict()
+
+# Concurrent lookups when checking several transactions at once; matches
+# the shared HTTP session's per-host pool size
+STATUS_WORKERS = 16
+
+
+def get_block_timestamp(client, round_num):
+    """
+    Gets the timestamp of a block, fetching only its header.
+    
+    Args:
+        client: AlgodClient instance
+        round_num: Block round
+        
+    Returns:
+        int: Unix timestamp of the block (0 if unknown)
+    """
+    ts = _block_ts_cache.get(round_num)
+    if ts is not None:
+        _block_ts_cache.move_to_end(round_num)
+        return ts
+    
+    # header_only skips the block's transactions, which are most of it
+    block = client.block_info(round_num, header_only=True)
+    ts = block.get('block', {}).get('ts', 0)
+    
+    _block_ts_cache[round_num] = ts
+    if len(_block_ts_cache) > BLOCK_TS_CACHE_MAX:
+        _block_ts_cache.popitem(last=False)
+    return ts
+
+
+def get_transaction_status(client, txid, quiet=False):
     """
     Retrieves the status and details of a transaction.
     
@@ -32,6 +77,7 @@ def get_transaction_status(client, txid):
     Args:
         client: AlgodClient instance
         txid: Transaction ID string
+        quiet: Don't print errors (batch mode reports them itself)
         
     Returns:
         tuple: (status_dict, is_confirmed)
@@ -50,19 +96,77 @@ def get_transaction_status(client, txid):
             # Transaction is still pending
             return pending_info, False
             
-    except Exception as e:
-        error_msg = str(e).lower()
+    except AlgodHTTPError as e:
+        if quiet:
+            return None, False
         
-        if "not found" in error_msg or "transaction not found" in error_msg:
+        # algod answers 404 for IDs it doesn't know
+        if e.code == 404:
             print(f"\n❌ Transaction not found: {txid}")
             print("\n   Possible reasons:")
             print("   • Transaction ID is incorrect")
             print("   • Transaction is too old (expired from pending pool)")
             print("   • Transaction was never submitted")
-            return None, False
         else:
             print(f"\n❌ Error retrieving transaction: {str(e)}")
-            return None, False
+        return None, False
+    
+    except Exception as e:
+        if not quiet:
+            print(f"\n❌ Error retrieving transaction: {str(e)}")
+        return None, False
+
+
+def get_many_statuses(client, txids, max_workers=STATUS_WORKERS):
+    """
+    Retrieves the status of many transactions concurrently.
+    
+    The lookups are independent, so they run on a thread pool over the
+    shared pooled HTTP session: N lookups take about as long as the
+    slowest one instead of N round-trips. Results are yielded as they
+    arrive.
+    
+    Args:
+        client: AlgodClient instance
+        txids: Transaction ID strings
+        max_workers: Maximum number of concurrent requests (default: 16)
+        
+    Yields:
+        tuple: (txid, status_dict, is_confirmed)
+    """
+    # Imported here: only needed for batch lookups
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_transaction_status, client, txid, True): txid
+            for txid in txids
+        }
+        for future in as_completed(futures):
+            txn_info, is_confirmed = future.result()
+            yield futures[future], txn_info, is_confirmed
+
+
+def check_many(client, txids):
+    """
+    Prints a one-line status for each transaction ID.
+    
+    Args:
+        client: AlgodClient instance
+        txids: Transaction ID strings
+    """
+    print(f"⏳ Checking {len(txids)} transactions...\n")
+    
+    for txid, txn_info, is_confirmed in get_many_statuses(client, txids):
+        if txn_info is None:
+            status = "❌ not found / error"
+        elif is_confirmed:
+            status = f"✅ confirmed in round {txn_info.get('confirmed-round')}"
+        elif txn_info.get('pool-error'):
+            status = f"❌ pool error: {txn_info['pool-error']}"
+        else:
+            status = "⏳ pending"
+        print(f"   {txid}  {status}")
 
 
 def display_pending_transaction(txn_info):
@@ -112,8 +216,7 @@ def display_confirmed_transaction(txn_info, client):
     
     # Get block timestamp if available
     try:
-        block = client.block_info(confirmed_round)
-        timestamp = block.get('block', {}).get('ts', 0)
+        timestamp = get_block_timestamp(client, confirmed_round)
         if timestamp:
             from datetime import datetime
             readable_time = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S UTC')
@@ -140,12 +243,22 @@ def display_confirmed_transaction(txn_info, client):
     # Note if present
     note = txn_data.get('note', None)
     if note:
+        # algod returns notes base64-encoded (msgpack responses give bytes)
         try:
-            # Try to decode as UTF-8
-            note_text = bytes.fromhex(note).decode('utf-8')
+            raw = note if isinstance(note, (bytes, bytearray)) else a2b_base64(note)
+        except ValueError:
+            raw = None
+        
+        # Decoding with replacement characters spots binary notes without
+        # raising and catching a UnicodeDecodeError
+        note_text = raw.decode('utf-8', 'replace') if raw is not None else None
+        if note_text is not None and '\ufffd' not in note_text:
             print(f"\n📝 NOTE:")
             print(f"   {note_text}")
-        except:
+        elif raw is not None:
+            print(f"\n📝 NOTE (binary, {len(raw)} bytes):")
+            print(f"   {raw.hex()}")
+        else:
             print(f"\n📝 NOTE (raw):")
             print(f"   {note}")
     
@@ -174,6 +287,17 @@ def main():
     print("\n🔍 TRANSACTION STATUS CHECKER")
     print("=" * 70)
     
+    # Several IDs (or --file with one ID per line): batch mode
+    txids = sys.argv[1:]
+    from_file = len(txids) == 2 and txids[0] == '--file'
+    if from_file:
+        with open(txids[1], encoding='utf-8') as f:
+            txids = [line.strip() for line in f if line.strip()]
+    if from_file or len(txids) > 1:
+        check_many(get_algod_client(), txids)
+        print("\n" + "=" * 70 + "\n")
+        return
+    
     # Get transaction ID from command line or user input
     if len(sys.argv) > 1:
         txid = sys.argv[1]
@@ -0,0 +1 @@
+"""Shared utilities for the playground scripts, deploy tools and API."""
@@ -11,35 +11,117 @@ The Algod client is used for:
 - Compiling smart contracts
 """
 
+from algosdk import constants, error
 from algosdk.v2client import algod
+import copy
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+import threading
+import time
 
-# Load environment variables from .env file
-load_dotenv()
+from utils.env import load_env
+from utils.http_session import get_session, json_loads
 
+# Suggested params only change once per round (~3.3s), so they are
+# cached for slightly less than that
+SUGGESTED_PARAMS_TTL = 3.0
 
+_params_lock = threading.Lock()
+_params_cache = None  # (client, params, expires_at)
+
+
+class PooledAlgodClient(algod.AlgodClient):
+    """
+    AlgodClient that sends its requests through the shared HTTP session.
+
+    The stock client opens a new connection for every call; this one
+    reuses pooled keep-alive connections (see utils/http_session.py).
+    Errors are raised exactly like the SDK does, so callers can keep
+    catching AlgodHTTPError.
+    """
+
+    def algod_request(
+        self,
+        method,
+        requrl,
+        params=None,
+        data=None,
+        headers=None,
+        response_format="json",
+        timeout=30
+    ):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = algod.api_version_path_prefix + requrl
+
+        resp = get_session().request(
+            method,
+            self.algod_address + requrl,
+            params=params,
+            data=data,
+            headers=header,
+            timeout=timeout
+        )
+
+        if resp.status_code >= 400:
+            try:
+                body = resp.json()
+            except ValueError:
+                raise error.AlgodHTTPError(resp.text, resp.status_code)
+            raise error.AlgodHTTPError(
+                body.get("message", resp.text), resp.status_code, body.get("data")
+            )
+
+        if response_format != "json":
+            return resp.content
+
+        # Some algod endpoints answer 200 OK with an empty body
+        if not resp.content:
+            return {}
+        try:
+            return json_loads(resp.content)
+        except ValueError as e:
+            raise error.AlgodResponseError(
+                "Failed to parse JSON response from algod"
+            ) from e
+
+
+@lru_cache(maxsize=None)
 def get_algod_client():
     """
-    Creates and returns an Algod client configured for TestNet.
+    Returns the Algod client configured for TestNet.
     
     The client connects to a public TestNet node provided by AlgoNode.
     This is free to use and doesn't require an API key for basic operations.
+    Requests go through a pooled keep-alive session, so consecutive calls
+    reuse the same connection.
+    
+    The client is created on the first call and the same instance is
+    returned afterwards, so the environment is only read once per process.
     
     Returns:
-        algod.AlgodClient: Configured Algod client instance
+        PooledAlgodClient: Configured Algod client instance
         
     Environment Variables:
         ALGOD_ADDRESS: The URL of the Algod node (defaults to AlgoNode TestNet)
         ALGOD_TOKEN: Authentication token (empty string for public nodes)
     """
+    # Settings from .env are loaded here, on first use, not at import
+    load_env()
+    
     # Get configuration from environment variables with sensible defaults
     algod_address = os.getenv("ALGOD_ADDRESS", "https://testnet-api.algonode.cloud")
     algod_token = os.getenv("ALGOD_TOKEN", "")
     
     # Create and return the client
     # Note: Public nodes don't require a token, so we pass an empty string
-    client = algod.AlgodClient(algod_token, algod_address)
+    client = PooledAlgodClient(algod_token, algod_address)
     
     return client
 
@@ -92,6 +174,38 @@ def get_suggested_params(client):
         return None
 
 
+def get_suggested_params_cached(client, ttl=SUGGESTED_PARAMS_TTL):
+    """
+    Gets suggested transaction parameters, reusing a recent response.
+    
+    Every transaction built within the same round gets the same
+    parameters, so bursts of sends share a single RPC. Concurrent
+    callers wait on one in-flight request instead of each issuing
+    their own.
+    
+    Unlike get_suggested_params, errors are raised to the caller.
+    
+    Args:
+        client: An AlgodClient instance
+        ttl: Seconds a response may be reused (default: 3.0)
+        
+    Returns:
+        SuggestedParams: A copy of the cached transaction parameters
+    """
+    global _params_cache
+    
+    with _params_lock:
+        cached = _params_cache
+        if (cached is None or cached[0] is not client
+                or time.monotonic() >= cached[2]):
+            params = client.suggested_params()
+            cached = (client, params, time.monotonic() + ttl)
+            _params_cache = cached
+    
+    # Callers may tweak fee/flat_fee, so never hand out the cached object
+    return copy.copy(cached[1])
+
+
 # Example usage and testing
 if __name__ == "__main__":
     print("Testing Algod Client Connection...")
@@ -0,0 +1,139 @@
+"""
+Build Artifact Cache
+
+A small on-disk cache for contract build artifacts (such as TEAL
+bytecode), stored under compiled/.<name>_cache/ in the project root.
+
+Entries are keyed by a content hash, so a changed source simply gets a
+new entry and stale entries are never returned. Writes go to a
+temporary file that is then renamed into place, so an interrupted run
+never leaves a half-written entry behind.
+
+Since every edit creates a new entry, the caches are kept under a total
+size cap: after each write, the least recently used entries (by access
+time) are removed until they fit.
+"""
+
+import hashlib
+import os
+
+
+# Cached artifacts live next to the compiled TEAL files
+CACHE_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "compiled"
+)
+
+# Total size all caches may take up before old entries are evicted
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def source_key(source):
+    """
+    Computes the cache key for a piece of source code.
+
+    Args:
+        source: Source text (str) or bytes
+
+    Returns:
+        str: Hex SHA-256 digest of the source
+    """
+    if isinstance(source, str):
+        source = source.encode()
+    return hashlib.sha256(source).hexdigest()
+
+
+def _entry_path(name, key):
+    return os.path.join(CACHE_ROOT, f".{name}_cache", f"{key}.bin")
+
+
+def read_cached(name, key):
+    """
+    Reads a cached artifact.
+
+    Args:
+        name: Cache name, e.g. "bytecode"
+        key: Entry key (see source_key)
+
+    Returns:
+        bytes: Cached data, or None on a cache miss
+    """
+    path = _entry_path(name, key)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    
+    # Mark the entry as recently used. Set explicitly because many
+    # filesystems are mounted noatime/relatime.
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+
+def write_cached(name, key, data):
+    """
+    Stores an artifact in the cache, atomically.
+
+    Failing to write the cache is never fatal; the artifact is simply
+    rebuilt next time.
+
+    Args:
+        name: Cache name, e.g. "bytecode"
+        key: Entry key (see source_key)
+        data: Artifact bytes
+    """
+    path = _entry_path(name, key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    
+    _evict(CACHE_MAX_BYTES)
+
+
+def _evict(max_bytes):
+    """Removes least recently used entries until all caches fit max_bytes."""
+    entries = []
+    total = 0
+    
+    try:
+        with os.scandir(CACHE_ROOT) as dirs:
+            cache_dirs = [
+                d.path for d in dirs
+                if d.name.startswith('.') and d.name.endswith('_cache') and d.is_dir()
+            ]
+        for cache_dir in cache_dirs:
+            with os.scandir(cache_dir) as files:
+                for entry in files:
+                    if entry.name.endswith('.bin'):
+                        st = entry.stat()
+                        entries.append((st.st_atime, st.st_size, entry.path))
+                        total += st.st_size
+    except OSError:
+        return
+    
+    if total <= max_bytes:
+        return
+    
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
@@ -0,0 +1,26 @@
+"""
+Environment Loading
+
+Node settings (ALGOD_ADDRESS, INDEXER_ADDRESS, ...) can be put in a .env
+file in the project root (see .env.example). Reading it touches the
+filesystem, so it is done once, on first use, by the client factories
+rather than whenever a utils module is imported.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_env():
+    """
+    Loads variables from .env into the environment, once per process.
+
+    Variables that are already set are left alone. python-dotenv is
+    optional: without it (e.g. on Vercel, where settings come from the
+    platform) only the real environment is used.
+    """
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
@@ -7,8 +7,45 @@ across multiple scripts in the playground.
 These helpers make the code more readable and reduce duplication.
 """
 
-from algosdk import encoding
+from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
+import hashlib
 import json
+import sys
+import time
+
+
+# Approximate time between Algorand blocks
+ROUND_TIME_SECONDS = 3.3
+
+# Retry delays (seconds) for wait_for_confirmation when algod is unreachable
+CONFIRMATION_BACKOFF_START = 0.25
+CONFIRMATION_BACKOFF_MAX = 2.0
+
+# 1 Algo = 1,000,000 microAlgos
+MICROALGOS_PER_ALGO = 1_000_000
+
+# Minimum balance for an account, and extra per asset held / app opted into
+MIN_BALANCE_UNIT = 100_000
+
+# Algorand addresses are 58 characters of uppercase RFC 4648 Base32
+ADDRESS_LENGTH = 58
+BASE32_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"
+
+# Deletes every valid Base32 character; anything left over is invalid
+_BASE32_STRIP = str.maketrans("", "", BASE32_ALPHABET)
+
+# Maps Base32 characters onto the digits int(..., 32) parses
+_BASE32_TO_DIGITS = str.maketrans(BASE32_ALPHABET, "0123456789abcdefghijklmnopqrstuv")
+
+# Empty SHA-512/256 hasher; copying it is cheaper than looking up the
+# algorithm by name for every hash. SHA-512/256 comes from OpenSSL and
+# may be missing on some builds; the SDK (which ships its own
+# implementation) is used as a fallback.
+try:
+    _SHA512_256 = hashlib.new('sha512_256')
+except ValueError:
+    _SHA512_256 = None
 
 
 def microalgos_to_algos(microalgos):
@@ -24,7 +61,7 @@ def microalgos_to_algos(microalgos):
     Returns:
         float: Amount in Algos
     """
-    return microalgos / 1_000_000
+    return microalgos / MICROALGOS_PER_ALGO
 
 
 def algos_to_microalgos(algos):
@@ -33,21 +70,33 @@ def algos_to_microalgos(algos):
     
     When building transactions, amounts must be specified in microAlgos.
     
+    The conversion is done in decimal rather than binary floating point,
+    where e.g. 0.29 * 1_000_000 comes out as 289999.99999999994 and would
+    be truncated to 289999. Anything below one microAlgo is dropped.
+    
     Args:
-        algos: Amount in Algos (float or int)
+        algos: Amount in Algos (int, float, Decimal or numeric string)
         
     Returns:
         int: Amount in microAlgos
     """
-    return int(algos * 1_000_000)
+    if isinstance(algos, int):
+        return algos * MICROALGOS_PER_ALGO
+    
+    # str() gives a float's shortest round-trip form ("0.29"), not its
+    # exact binary value
+    micro = Decimal(str(algos)) * MICROALGOS_PER_ALGO
+    return int(micro.to_integral_value(rounding=ROUND_DOWN))
 
 
+@lru_cache(maxsize=512)
 def format_address(address):
     """
     Formats an Algorand address for display.
     
     Algorand addresses are 58 characters long. This function displays
-    them in a truncated format for readability when needed.
+    them in a truncated format for readability when needed. The same few
+    addresses are formatted over and over, so results are memoized.
     
     Args:
         address: Full Algorand address
@@ -74,6 +123,42 @@ def validate_address(address):
     Returns:
         bool: True if valid, False otherwise
     """
+    # Cheap length and alphabet checks reject most malformed input
+    # before paying for the Base32 decode and checksum hash
+    if not isinstance(address, str) or len(address) != ADDRESS_LENGTH:
+        return False
+    if address.translate(_BASE32_STRIP):
+        return False
+
+    return _address_checksum_ok(address)
+
+
+# The same addresses (senders, frequent receivers) are validated over and
+# over, so checksum results for well-formed strings are memoized
+@lru_cache(maxsize=4096)
+def _address_checksum_ok(address):
+    if _SHA512_256 is None:
+        return _sdk_address_ok(address)
+    
+    # Decode all 58 Base32 characters at once: map them onto the digits
+    # int() understands for base 32 and parse a single 290-bit integer.
+    # The top 288 bits are the 32-byte public key + 4-byte checksum (the
+    # last 2 bits are Base32 padding).
+    value = int(address.translate(_BASE32_TO_DIGITS), 32) >> 2
+    raw = value.to_bytes(36, 'big')
+    public_key, checksum = raw[:32], raw[32:]
+    
+    # The checksum is the last 4 bytes of SHA-512/256(public key)
+    digest = _SHA512_256.copy()
+    digest.update(public_key)
+    return digest.digest()[-4:] == checksum
+
+
+def _sdk_address_ok(address):
+    # Imported here: loading algosdk is the bulk of this module's import
+    # cost, and most helpers don't need it
+    from algosdk import encoding
+    
     try:
         # The encoding module will raise an exception if invalid
         encoding.decode_address(address)
@@ -82,6 +167,7 @@ def validate_address(address):
         return False
 
 
+@lru_cache(maxsize=512)
 def format_transaction_id(txid):
     """
     Formats a transaction ID for display.
@@ -98,6 +184,30 @@ def format_transaction_id(txid):
     return f"{txid[:8]}...{txid[-8:]}"
 
 
+def format_mnemonic_grid(mnemonic_phrase, per_row=5):
+    """
+    Formats a mnemonic as a numbered grid (easier to write down).
+    
+    Args:
+        mnemonic_phrase: Mnemonic words separated by spaces
+        per_row: Number of words per row (default: 5)
+        
+    Returns:
+        str: The grid, one row per line
+    """
+    words = mnemonic_phrase.split()
+    count = len(words)
+    
+    # Index into words directly rather than slicing out each row
+    return "\n".join(
+        "   " + "  ".join(
+            f"{i + 1:2d}. {words[i]:12s}"
+            for i in range(row, min(row + per_row, count))
+        )
+        for row in range(0, count, per_row)
+    )
+
+
 def print_account_info(address, balance, client=None):
     """
     Prints formatted account information.
@@ -110,21 +220,26 @@ def print_account_info(address, balance, client=None):
         balance: Balance in microAlgos
         client: Optional AlgodClient to fetch additional info
     """
-    print(f"\nAccount Information:")
-    print(f"{'=' * 60}")
-    print(f"Address: {address}")
-    print(f"Balance: {microalgos_to_algos(balance):.6f} ALGO")
-    print(f"         ({balance:,} microAlgos)")
+    lines = [
+        f"\nAccount Information:",
+        "=" * 60,
+        f"Address: {address}",
+        f"Balance: {microalgos_to_algos(balance):.6f} ALGO",
+        f"         ({balance:,} microAlgos)"
+    ]
     
     if client:
         try:
-            account_info = client.account_info(address)
-            print(f"Status: {account_info.get('status', 'Unknown')}")
-            print(f"Round: {account_info.get('round', 'N/A')}")
+            account_info = client.account_info(address, exclude="all")
+            lines.append(f"Status: {account_info.get('status', 'Unknown')}")
+            lines.append(f"Round: {account_info.get('round', 'N/A')}")
         except Exception as e:
-            print(f"Note: Could not fetch additional info ({e})")
+            lines.append(f"Note: Could not fetch additional info ({e})")
+    
+    lines.append("=" * 60)
     
-    print(f"{'=' * 60}")
+    # One write for the whole block instead of one per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_transaction_summary(txid, sender, receiver, amount, fee, round_num=None):
@@ -139,18 +254,36 @@ def print_transaction_summary(txid, sender, receiver, amount, fee, round_num=Non
         fee: Fee in microAlgos
         round_num: Optional round number
     """
-    print(f"\nTransaction Summary:")
-    print(f"{'=' * 60}")
-    print(f"TX ID: {txid}")
-    print(f"From:  {format_address(sender)}")
-    print(f"To:    {format_address(receiver)}")
-    print(f"Amount: {microalgos_to_algos(amount):.6f} ALGO")
-    print(f"Fee:    {microalgos_to_algos(fee):.6f} ALGO")
+    lines = [
+        f"\nTransaction Summary:",
+        "=" * 60,
+        f"TX ID: {txid}",
+        f"From:  {format_address(sender)}",
+        f"To:    {format_address(receiver)}",
+        f"Amount: {microalgos_to_algos(amount):.6f} ALGO",
+        f"Fee:    {microalgos_to_algos(fee):.6f} ALGO"
+    ]
     
     if round_num:
-        print(f"Round:  {round_num}")
+        lines.append(f"Round:  {round_num}")
+    
+    lines.append("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _pending_transaction_info(client, txid):
+    """
+    Fetches pending transaction info as msgpack, algod's native encoding.
     
-    print(f"{'=' * 60}")
+    Smaller on the wire and faster to decode than JSON, which adds up in
+    the confirmation loops. Top-level fields (confirmed-round, pool-error,
+    application-index, ...) are the same as in the JSON response; binary
+    fields inside the transaction come back as bytes instead of base64.
+    """
+    import msgpack
+    
+    raw = client.pending_transaction_info(txid, response_format="msgpack")
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
 
 
 def wait_for_confirmation(client, txid, timeout=10):
@@ -158,8 +291,14 @@ def wait_for_confirmation(client, txid, timeout=10):
     Waits for a transaction to be confirmed on the blockchain.
     
     After submitting a transaction, you need to wait for it to be
-    included in a block. This function polls the network until
-    confirmation or timeout.
+    included in a block. This function checks the transaction once per
+    round, using algod's wait-for-block-after endpoint to block until
+    the next round is committed, until confirmation or timeout.
+    
+    If the node can't be reached, it retries with exponential backoff
+    (0.25s, doubling up to 2s) instead of counting rounds blindly. If the
+    node reports a pool error, the transaction was rejected and it stops
+    waiting right away.
     
     Args:
         client: AlgodClient instance
@@ -174,26 +313,35 @@ def wait_for_confirmation(client, txid, timeout=10):
     try:
         # Get the current round as a starting point
         last_round = client.status().get('last-round')
-        current_round = last_round + 1
-        timeout_round = current_round + timeout
+        timeout_round = last_round + timeout
+        backoff = CONFIRMATION_BACKOFF_START
         
         # Poll until transaction confirms or we timeout
-        while current_round < timeout_round:
+        while last_round < timeout_round:
             try:
                 # Check if transaction is confirmed
-                pending_txn = client.pending_transaction_info(txid)
+                pending_txn = _pending_transaction_info(client, txid)
                 
                 if pending_txn.get("confirmed-round", 0) > 0:
                     print(f"✓ Transaction confirmed in round {pending_txn.get('confirmed-round')}")
                     return pending_txn
                 
-                # Wait for next round
-                client.status_after_block(current_round)
-                current_round += 1
+                # The node dropped the transaction; it will never confirm
+                pool_error = pending_txn.get("pool-error")
+                if pool_error:
+                    print(f"✗ Transaction rejected: {pool_error}")
+                    return None
+                
+                # Block until the round after last_round is committed
+                status = client.status_after_block(last_round)
+                last_round = status.get('last-round', last_round + 1)
+                backoff = CONFIRMATION_BACKOFF_START
                 
             except Exception as e:
-                print(f"Waiting... (round {current_round})")
-                current_round += 1
+                print(f"Waiting... (round {last_round + 1})")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, CONFIRMATION_BACKOFF_MAX)
+                last_round += 1
         
         print(f"✗ Transaction not confirmed after {timeout} rounds")
         return None
@@ -203,6 +351,59 @@ def wait_for_confirmation(client, txid, timeout=10):
         return None
 
 
+def poll_for_confirmation(client, txid, timeout_seconds=8.0, interval=0.5):
+    """
+    Waits for a transaction confirmation within a wall-clock budget.
+    
+    Instead of polling on a fixed short interval, this long-polls
+    algod's wait-for-block-after endpoint (status_after_block), which
+    returns as soon as the next round is committed, and only then checks
+    the pending transaction again. That is roughly one RPC pair per
+    round. Each long-poll is capped by the remaining budget, so a request
+    handler gives up after at most `timeout_seconds`.
+    
+    If the long-poll fails, it falls back to sleeping with exponential
+    backoff, starting at `interval` and capped at the round time.
+    
+    Args:
+        client: AlgodClient instance
+        txid: Transaction ID to wait for
+        timeout_seconds: Maximum time to wait in seconds (default: 8.0)
+        interval: Initial fallback delay in seconds (default: 0.5)
+        
+    Returns:
+        dict: Transaction information if confirmed, None if timeout
+    """
+    deadline = time.monotonic() + timeout_seconds
+    last_round = None
+    
+    while True:
+        try:
+            pending_txn = _pending_transaction_info(client, txid)
+            if pending_txn.get("confirmed-round", 0) > 0:
+                return pending_txn
+            if pending_txn.get("pool-error"):
+                return None
+        except Exception:
+            pass
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        
+        try:
+            if last_round is None:
+                last_round = client.status().get('last-round')
+            status = client.status_after_block(last_round, timeout=remaining)
+            last_round = status.get('last-round', last_round + 1)
+        except Exception:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, ROUND_TIME_SECONDS)
+
+
 def get_min_balance_requirement(num_assets=0, num_apps=0):
     """
     Calculates the minimum balance requirement for an account.
@@ -221,22 +422,53 @@ def get_min_balance_requirement(num_assets=0, num_apps=0):
     Returns:
         int: Minimum balance in microAlgos
     """
-    base_min_balance = 100_000  # 0.1 ALGO
-    asset_min_balance = 100_000  # per asset
-    app_min_balance = 100_000    # per app
-    
-    total = base_min_balance + (num_assets * asset_min_balance) + (num_apps * app_min_balance)
-    return total
+    # Base, per-asset and per-app requirements are all 0.1 ALGO, so the
+    # total is a single multiply
+    return MIN_BALANCE_UNIT * (1 + num_assets + num_apps)
 
 
 def pretty_print_json(data):
     """
     Pretty prints JSON data for debugging and display.
     
+    Uses orjson when it is installed (much faster on large responses
+    such as blocks), and the standard library otherwise or for data
+    orjson can't encode (e.g. non-string keys, integers over 64 bits).
+    
     Args:
         data: Dictionary or JSON-serializable object
     """
-    print(json.dumps(data, indent=2, sort_keys=True))
+    try:
+        import orjson
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    except (ImportError, TypeError):
+        # orjson.JSONEncodeError is a TypeError
+        print(json.dumps(data, indent=2, sort_keys=True))
+        return
+    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encoded + b"\n")
+    sys.stdout.flush()
+
+
+def write_json(data):
+    """
+    Writes data to stdout as compact JSON, for the scripts' --json modes.
+    
+    Uses orjson when it is installed, writing the encoded bytes directly,
+    and falls back to the standard library otherwise.
+    
+    Args:
+        data: Dictionary or JSON-serializable object
+    """
+    try:
+        import orjson
+    except ImportError:
+        sys.stdout.write(json.dumps(data) + "\n")
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data) + b"\n")
+    sys.stdout.flush()
 
 
 # Example usage
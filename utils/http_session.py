@@ -0,0 +1,78 @@
+"""
+Shared HTTP Session
+
+The Algorand SDK clients open a brand new TCP/TLS connection for every
+REST call (they use urllib under the hood). This module provides one
+pooled, keep-alive requests.Session that the Algod and Indexer clients
+send their requests through instead.
+
+This matters most for flows that make several calls in a row, such as:
+- suggested_params() -> account_info() -> send_transaction()
+- Polling pending_transaction_info() while waiting for confirmation
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Response bodies are parsed with orjson when it is installed (the API
+# requires it); the scripts fall back to the standard library. Both
+# raise a ValueError subclass on invalid JSON.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+# Connection pool sizing: a handful of hosts (algod + indexer),
+# several concurrent connections per host
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Rate limiting and transient gateway errors worth retrying (idempotent
+# requests only)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+_session = None
+
+
+def get_session():
+    """
+    Returns the process-wide pooled HTTP session.
+
+    The session is created on first use and reused afterwards, so
+    connections to the Algorand nodes stay open between calls.
+
+    Returns:
+        requests.Session: Shared session with a pooled adapter mounted
+    """
+    global _session
+
+    if _session is None:
+        # Only idempotent requests are retried (urllib3 default), so a
+        # transaction submission is never sent twice. Read timeouts are
+        # not retried, so long-polls (wait-for-block-after) honour their
+        # timeout instead of silently running it up to three times.
+        # Rate limits and gateway errors from overloaded public nodes are
+        # retried too, with exponential backoff (honouring Retry-After on
+        # 429); if they persist the last response is returned as usual, so
+        # callers still see an AlgodHTTPError/IndexerHTTPError.
+        retry = Retry(
+            total=2,
+            read=0,
+            backoff_factor=0.1,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+
+    return _session
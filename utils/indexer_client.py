@@ -11,38 +11,254 @@ It's useful for:
 - Analytics and reporting
 """
 
+from algosdk import constants, error
 from algosdk.v2client import indexer
+import logging
+import math
 import os
-from dotenv import load_dotenv
+import time
+from functools import lru_cache
 
-# Load environment variables
-load_dotenv()
+from utils.env import load_env
+from utils.http_session import get_session, json_loads
 
+# Failed lookups in batch searches are logged, not printed. Without any
+# logging setup Python still shows warnings on stderr, so they stay out
+# of the scripts' --json output.
+logger = logging.getLogger(__name__)
 
+# Upper bound on how long a search result may be reused. Results are
+# dropped sooner once another response shows a newer indexed round (see
+# search_transactions_cached). Override with INDEXER_CACHE_TTL (see
+# indexer_cache_ttl()).
+DEFAULT_INDEXER_CACHE_TTL = 20.0
+HEALTH_CACHE_TTL = 2.0
+HEALTH_FAILURE_TTL = 1.0
+INDEXER_CACHE_MAX = 1024
+
+# Page size for iter_transactions_by_address (the public Indexer's
+# maximum is 1000)
+ITER_PAGE_SIZE = 1000
+
+# Concurrent queries for multi-address searches. Kept below the shared
+# HTTP session's per-host pool size (16) and low enough not to trip the
+# public Indexer's rate limit; 429s that still happen are retried with
+# backoff by the session. Override with INDEXER_MAX_CONCURRENCY (see
+# search_workers()).
+DEFAULT_SEARCH_WORKERS = 8
+
+# Cache key -> (expires_at, response)
+_response_cache = {}
+
+# Client -> newest round seen in any Indexer response
+_latest_round = {}
+
+
+def _env_number(name, default, cast, minimum):
+    """
+    Reads a numeric setting from the environment (including .env).
+    
+    Missing, malformed or out-of-range values fall back to `default`
+    with a warning, rather than breaking every Indexer query.
+    """
+    load_env()
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = cast(raw)
+    except ValueError:
+        value = None
+    if value is None or not math.isfinite(value) or value < minimum:
+        logger.warning("Ignoring invalid %s=%r, using %s", name, raw, default)
+        return default
+    return value
+
+
+@lru_cache(maxsize=None)
+def indexer_cache_ttl():
+    """Seconds a search result may be reused (INDEXER_CACHE_TTL)."""
+    return _env_number("INDEXER_CACHE_TTL", DEFAULT_INDEXER_CACHE_TTL, float, 0)
+
+
+@lru_cache(maxsize=None)
+def search_workers():
+    """Concurrent queries for multi-address searches (INDEXER_MAX_CONCURRENCY)."""
+    return _env_number("INDEXER_MAX_CONCURRENCY", DEFAULT_SEARCH_WORKERS, int, 1)
+
+
+class IndexerError(Exception):
+    """Raised when an Indexer query fails (HTTP error or unreachable node)."""
+
+
+class PooledIndexerClient(indexer.IndexerClient):
+    """
+    IndexerClient that sends its requests through the shared HTTP session.
+
+    Same behaviour as the stock client (including IndexerHTTPError on
+    failures), but consecutive queries reuse pooled keep-alive connections.
+    """
+
+    def indexer_request(
+        self, method, requrl, params=None, data=None, headers=None, timeout=30
+    ):
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if (requrl not in constants.no_auth) and self.indexer_token:
+            header[constants.indexer_auth_header] = self.indexer_token
+        if requrl not in constants.unversioned_paths:
+            requrl = indexer.api_version_path_prefix + requrl
+
+        resp = get_session().request(
+            method,
+            self.indexer_address + requrl,
+            params=params,
+            data=data,
+            headers=header,
+            timeout=timeout
+        )
+
+        if resp.status_code >= 400:
+            try:
+                message = resp.json()["message"]
+            except (ValueError, KeyError, TypeError):
+                message = resp.text
+            raise error.IndexerHTTPError(message)
+
+        # Search results can be large; orjson parses them much faster
+        return json_loads(resp.content)
+
+
+@lru_cache(maxsize=None)
 def get_indexer_client():
     """
-    Creates and returns an Indexer client configured for TestNet.
+    Returns the Indexer client configured for TestNet.
     
     The Indexer client provides read-only access to historical blockchain data.
     We use AlgoNode's free public Indexer service for TestNet.
+    Requests go through a pooled keep-alive session.
+    
+    The client is created on the first call and the same instance is
+    returned afterwards, so the environment is only read once per process.
     
     Returns:
-        indexer.IndexerClient: Configured Indexer client instance
+        PooledIndexerClient: Configured Indexer client instance
         
     Environment Variables:
         INDEXER_ADDRESS: The URL of the Indexer service
         INDEXER_TOKEN: Authentication token (empty for public indexers)
     """
+    # Settings from .env are loaded here, on first use, not at import
+    load_env()
+    
     # Get configuration from environment with defaults
     indexer_address = os.getenv("INDEXER_ADDRESS", "https://testnet-idx.algonode.cloud")
     indexer_token = os.getenv("INDEXER_TOKEN", "")
     
     # Create and return the indexer client
-    client = indexer.IndexerClient(indexer_token, indexer_address)
+    client = PooledIndexerClient(indexer_token, indexer_address)
     
     return client
 
 
+def _cache_get(key):
+    hit = _response_cache.get(key)
+    if hit and time.monotonic() < hit[0]:
+        return hit[1]
+    return None
+
+
+def _cache_put(key, ttl, response):
+    if len(_response_cache) >= INDEXER_CACHE_MAX:
+        _response_cache.clear()
+    _response_cache[key] = (time.monotonic() + ttl, response)
+
+
+def _note_round(client, round_num):
+    """Records a round the Indexer reported (current-round or health round)."""
+    if round_num and round_num > _latest_round.get(client, 0):
+        _latest_round[client] = round_num
+
+
+def clear_indexer_cache():
+    """Drops all cached Indexer responses (e.g. after sending a transaction)."""
+    _response_cache.clear()
+
+
+def get_health_cached(client, ttl=HEALTH_CACHE_TTL):
+    """
+    Gets the Indexer's health, reusing a response from the last `ttl`
+    seconds. Errors are raised to the caller.
+    
+    Failures are cached too, for HEALTH_FAILURE_TTL seconds: while the
+    Indexer is down, repeated checks fail immediately with the same error
+    instead of each probing the struggling service again.
+    
+    Args:
+        client: An IndexerClient instance
+        ttl: Seconds a response may be reused (default: 2.0)
+        
+    Returns:
+        dict: Health status information
+    """
+    key = ("health", client)
+    health = _cache_get(key)
+    if isinstance(health, Exception):
+        # Drop the previous traceback so re-raising doesn't extend it
+        raise health.with_traceback(None)
+    if health is None:
+        try:
+            health = client.health()
+        except Exception as e:
+            _cache_put(key, HEALTH_FAILURE_TTL, e)
+            raise
+        _cache_put(key, ttl, health)
+        _note_round(client, health.get('round'))
+    return health
+
+
+def search_transactions_cached(client, address, limit=10, ttl=None):
+    """
+    Searches an address's transactions, reusing a recent identical query.
+    
+    Dashboards and history views repeat the same (address, limit) query
+    often; those are answered from memory instead of another round-trip
+    to the Indexer, for at most `ttl` seconds.
+    
+    The Indexer sends no ETag or Last-Modified header, and asking it for
+    its round first would cost a request of its own. Instead, every
+    response carries the `current-round` it was read at: once any other
+    response (a search, a page, a health check) shows a newer round, the
+    cached result is dropped early. Without such traffic, a result can
+    be up to `ttl` seconds behind.
+    
+    The cached response is shared, so callers must not modify it.
+    Errors are raised to the caller.
+    
+    Args:
+        client: An IndexerClient instance
+        address: Algorand address to search for
+        limit: Maximum number of transactions to return
+        ttl: Seconds a response may be reused (default: indexer_cache_ttl())
+        
+    Returns:
+        dict: Transaction search results
+    """
+    key = ("txns", client, address, limit)
+    response = _cache_get(key)
+    latest = _latest_round.get(client, 0)
+    if response is not None and response.get('current-round', latest) >= latest:
+        return response
+    
+    response = client.search_transactions_by_address(address, limit=limit)
+    _note_round(client, response.get('current-round'))
+    _cache_put(key, indexer_cache_ttl() if ttl is None else ttl, response)
+    return response
+
+
 def get_indexer_health(client):
     """
     Checks the health status of the Indexer service.
@@ -57,13 +273,14 @@ def get_indexer_health(client):
         
     Returns:
         dict: Health status information
+        
+    Raises:
+        IndexerError: If the Indexer can't be reached or returns an error
     """
     try:
-        health = client.health()
-        return health
+        return get_health_cached(client)
     except Exception as e:
-        print(f"Error checking indexer health: {e}")
-        return None
+        raise IndexerError(f"Error checking indexer health: {e}") from e
 
 
 def search_transactions_by_address(client, address, limit=10):
@@ -71,7 +288,11 @@ def search_transactions_by_address(client, address, limit=10):
     Searches for transactions involving a specific address.
     
     This is one of the most common Indexer operations, allowing you to
-    view the transaction history for any account.
+    view the transaction history for any account. Repeated queries are
+    served from a short-lived cache (see search_transactions_cached).
+    
+    The returned dict may be shared with other callers, so callers must
+    not modify it.
     
     Args:
         client: An IndexerClient instance
@@ -80,17 +301,106 @@ def search_transactions_by_address(client, address, limit=10):
         
     Returns:
         dict: Transaction search results
+        
+    Raises:
+        IndexerError: If the Indexer can't be reached or returns an error
     """
     try:
-        response = client.search_transactions_by_address(address, limit=limit)
-        return response
+        return search_transactions_cached(client, address, limit)
     except Exception as e:
-        print(f"Error searching transactions: {e}")
-        return None
+        raise IndexerError(f"Error searching transactions for {address}: {e}") from e
+
+
+def iter_transactions_by_address(client, address, page_size=ITER_PAGE_SIZE, **filters):
+    """
+    Iterates over all transactions of an address, one page at a time.
+    
+    Only the current page is held in memory, so scanning a long history
+    uses the same memory as a single query. Larger pages mean fewer
+    round-trips but bigger responses; 100-1000 is a good range.
+    
+    Errors are raised to the caller.
+    
+    Args:
+        client: An IndexerClient instance
+        address: Algorand address to search for
+        page_size: Transactions per request (default: 1000)
+        **filters: Extra search filters (txn_type, min_round, ...)
+        
+    Yields:
+        dict: Transactions, newest first
+    """
+    next_page = None
+    while True:
+        response = client.search_transactions_by_address(
+            address, limit=page_size, next_page=next_page, **filters
+        )
+        _note_round(client, response.get('current-round'))
+        transactions = response.get('transactions', [])
+        yield from transactions
+        
+        next_page = response.get('next-token')
+        # A short page is the last one; skip the empty request after it
+        if not next_page or len(transactions) < page_size:
+            return
+
+
+def search_transactions_by_addresses(
+    client, addresses, limit=10, max_workers=None, page_size=None, **filters
+):
+    """
+    Searches the recent transactions of several addresses concurrently.
+    
+    The queries are independent, so they run on a thread pool sharing
+    the pooled HTTP session: N lookups take about as long as the slowest
+    one rather than N round-trips. Each address is paged through
+    iter_transactions_by_address until `limit` transactions are found.
+    
+    Args:
+        client: An IndexerClient instance
+        addresses: Algorand addresses to search for
+        limit: Maximum number of transactions per address
+        max_workers: Maximum number of concurrent queries (default:
+            search_workers())
+        page_size: Transactions per request (default: min(limit, 1000))
+        **filters: Extra search filters (txn_type, min_round, ...)
+        
+    Returns:
+        dict: Address -> list of transactions, newest first (None if
+        that address's search failed)
+        
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    # Imported here: only needed for multi-address lookups
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+    
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    if page_size is None:
+        page_size = min(limit, ITER_PAGE_SIZE)
+    if max_workers is None:
+        max_workers = search_workers()
+    
+    def search(address):
+        # One failed address shouldn't cost the results of the others
+        try:
+            pages = iter_transactions_by_address(client, address, page_size, **filters)
+            return list(islice(pages, limit))
+        except Exception as e:
+            logger.warning("Error searching transactions for %s: %s", address, e)
+            return None
+    
+    addresses = list(dict.fromkeys(addresses))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(addresses, executor.map(search, addresses)))
 
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("Testing Indexer Client Connection...")
     print("-" * 50)
     
@@ -98,13 +408,13 @@ if __name__ == "__main__":
     client = get_indexer_client()
     
     # Check health
-    health = get_indexer_health(client)
-    if health:
+    try:
+        health = get_indexer_health(client)
         print(f"✓ Indexer is healthy")
         print(f"  Status: Online")
         print(f"  Round: {health.get('round', 'N/A')}")
-    else:
-        print("✗ Failed to connect to indexer")
+    except IndexerError as e:
+        print(f"✗ Failed to connect to indexer ({e})")
     
     print("-" * 50)
     print("\nIndexer is ready to search transaction history!")
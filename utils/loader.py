@@ -0,0 +1,76 @@
+"""
+Contract Module Loader
+
+Imports PyTeal contract modules from their file paths. Used by both
+deploy/compile_contract.py and deploy/deploy_contract.py.
+
+Loaded modules are remembered by absolute path, so loading the same
+contract again in one process (notebooks, repeated compile/deploy
+calls) doesn't re-execute it.
+"""
+
+import importlib.util
+import os
+import pkgutil
+import sys
+
+
+# Absolute contract path -> loaded module
+_contract_cache = {}
+
+
+def _find_spec(module_name, path):
+    """
+    Finds the module spec for a contract file.
+    
+    pkgutil.get_importer() returns the directory's FileFinder from
+    sys.path_importer_cache, so contracts in the same directory share one
+    finder and its cached directory listing instead of building a new
+    one per contract.
+    """
+    finder = pkgutil.get_importer(os.path.dirname(path))
+    spec = finder.find_spec(module_name) if finder else None
+    
+    # The finder may resolve the name to something else (a package or
+    # extension module of the same name); load the exact file then
+    if spec is None or spec.origin != path:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+    return spec
+
+
+def load_contract(contract_path):
+    """
+    Imports a PyTeal contract module from a file path.
+
+    Args:
+        contract_path: Path to the contract .py file
+
+    Returns:
+        module: The imported module, or None if the import failed
+    """
+    key = os.path.abspath(contract_path)
+
+    module = _contract_cache.get(key)
+    if module is not None:
+        return module
+
+    module_name = os.path.splitext(os.path.basename(key))[0]
+
+    # Reuse the module if it was already imported normally, but only if
+    # it really is this file (a contract could share a name with
+    # another module)
+    module = sys.modules.get(module_name)
+    if module is not None and getattr(module, '__file__', None) == key:
+        _contract_cache[key] = module
+        return module
+
+    try:
+        spec = _find_spec(module_name, key)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as e:
+        print(f"❌ Error importing contract: {str(e)}")
+        return None
+
+    _contract_cache[key] = module
+    return module
@@ -0,0 +1,142 @@
+"""
+Mnemonic Decoding
+
+Turns a 25-word Algorand mnemonic into its key in one pass, with the
+same rules as algosdk.mnemonic (words or their 4+ letter prefixes,
+case-insensitive):
+
+- The first 24 words are 11-bit indexes into the BIP39 English word
+  list, packed least significant first into 33 bytes: the 32-byte key
+  followed by a zero byte.
+- The 25th word is the checksum: the first 11 bits of
+  SHA-512/256(key).
+
+Words are looked up in a table built once at import, and every word
+and the checksum are verified before any key derivation happens, so a
+bad phrase is rejected with a precise message and no crypto work.
+"""
+
+import base64
+import hashlib
+
+from algosdk import encoding, wordlist
+from nacl.signing import SigningKey
+
+
+MNEMONIC_WORDS = 25
+
+# Empty SHA-512/256 hasher, copied for each checksum (cheaper than
+# looking the algorithm up by name every time). Builds whose OpenSSL
+# lacks SHA-512/256 fall back to the SDK's implementation.
+try:
+    _SHA512_256 = hashlib.new('sha512_256')
+except ValueError:
+    _SHA512_256 = None
+
+# The 2048 words, in index order
+WORDS = tuple(wordlist.word_list_raw().split())
+
+# BIP39 words are unique in their first 4 letters, so one entry per word
+# (keyed by those letters, or the whole word if shorter) is enough to
+# resolve any accepted prefix; see word_index()
+_PREFIX_TO_INDEX = {word[:4]: index for index, word in enumerate(WORDS)}
+
+
+def word_index(word):
+    """
+    Looks up a mnemonic word, or a prefix of at least 4 letters of one.
+    
+    Args:
+        word: Lowercase word
+        
+    Returns:
+        int: The word's index, or None if it isn't a known word
+    """
+    index = _PREFIX_TO_INDEX.get(word[:4])
+    if index is None or not WORDS[index].startswith(word):
+        return None
+    return index
+
+
+def mnemonic_to_key(mnemonic_phrase):
+    """
+    Decodes a mnemonic into the 32-byte key (ed25519 seed) it encodes.
+    
+    Args:
+        mnemonic_phrase: String containing 25 words separated by spaces
+        
+    Returns:
+        bytes: 32-byte key
+        
+    Raises:
+        ValueError: If the word count, a word or the checksum is wrong
+    """
+    words = mnemonic_phrase.lower().split()
+    if len(words) != MNEMONIC_WORDS:
+        raise ValueError(f"Expected {MNEMONIC_WORDS} words, got {len(words)}")
+    
+    value = 0
+    for position, word in enumerate(words[:-1]):
+        index = word_index(word)
+        if index is None:
+            raise ValueError(f"Unknown word '{word}' (word {position + 1})")
+        value |= index << (11 * position)
+    
+    checksum_index = word_index(words[-1])
+    if checksum_index is None:
+        raise ValueError(f"Unknown word '{words[-1]}' (word {MNEMONIC_WORDS})")
+    
+    # 24 words carry 264 bits: the key plus 8 bits that must be zero
+    if value >> 256:
+        raise ValueError("Invalid checksum")
+    key = value.to_bytes(32, 'little')
+    
+    if _SHA512_256 is None:
+        digest = encoding.checksum(key)
+    else:
+        hasher = _SHA512_256.copy()
+        hasher.update(key)
+        digest = hasher.digest()
+    if int.from_bytes(digest[:2], 'little') & 0x7FF != checksum_index:
+        raise ValueError("Invalid checksum")
+    
+    return key
+
+
+def account_from_key(key):
+    """
+    Derives an account's private key and address from its 32-byte key.
+    
+    Args:
+        key: 32-byte key (ed25519 seed), e.g. from mnemonic_to_key()
+        
+    Returns:
+        tuple: (private_key, address), private key in base64 like the SDK
+    """
+    signing_key = SigningKey(key)
+    public_key = signing_key.verify_key.encode()
+    
+    private_key = base64.b64encode(signing_key.encode() + public_key).decode()
+    address = encoding.encode_address(public_key)
+    
+    return private_key, address
+
+
+def recover_from_mnemonic(mnemonic_phrase):
+    """
+    Recovers an account's private key and address from its mnemonic.
+    
+    Equivalent to mnemonic.to_private_key() followed by
+    account.address_from_private_key(), but derives the key pair only
+    once.
+    
+    Args:
+        mnemonic_phrase: String containing 25 words separated by spaces
+        
+    Returns:
+        tuple: (private_key, address), private key in base64 like the SDK
+        
+    Raises:
+        ValueError: If the mnemonic is invalid
+    """
+    return account_from_key(mnemonic_to_key(mnemonic_phrase))
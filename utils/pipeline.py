@@ -0,0 +1,244 @@
+"""
+Contract Build Pipeline
+
+Shared PyTeal -> TEAL step used by deploy/compile_contract.py and
+deploy/deploy_contract.py.
+
+Compiling a PyTeal contract means importing it and walking its whole
+expression tree, which is the slowest part of both scripts. The result
+only depends on the contract source and the PyTeal version, so it is
+cached on disk (see utils/build_cache.py) and reused until the contract
+file changes.
+
+TEAL saved by compile_contract.py (compiled/<name>_approval.teal,
+<name>_clear.teal and <name>.meta.json) is also picked up by get_teal(),
+so "compile, then deploy" compiles the contract only once. The meta file
+records the build-cache key and dependencies the TEAL was built from,
+and the files are only reused while those still match.
+"""
+
+import json
+import os
+import sys
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from types import ModuleType
+
+from utils.build_cache import CACHE_ROOT, source_key, read_cached, write_cached
+from utils.loader import load_contract
+
+
+# Where compile_contract.py saves TEAL files
+COMPILED_DIR = CACHE_ROOT
+
+# Only modules inside the project count as contract dependencies
+_PROJECT_ROOT = os.path.dirname(CACHE_ROOT)
+
+
+class ContractError(Exception):
+    """Raised when a contract module doesn't follow the expected layout."""
+
+
+def _pyteal_version():
+    try:
+        return version("pyteal")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _teal_cache_key(contract_path):
+    """Builds the cache key from the contract file's identity and PyTeal."""
+    path = os.path.abspath(contract_path)
+    st = os.stat(path)
+    return source_key(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\0{_pyteal_version()}")
+
+
+def _module_deps(contract_module):
+    """
+    Finds the project modules a contract uses (e.g. shared subroutines),
+    as [path, mtime_ns] pairs.
+    """
+    contract_file = os.path.abspath(contract_module.__file__)
+    deps = {}
+    
+    for value in vars(contract_module).values():
+        if isinstance(value, ModuleType):
+            module = value
+        else:
+            module = sys.modules.get(getattr(value, '__module__', None) or '')
+        
+        path = getattr(module, '__file__', None)
+        if not path:
+            continue
+        path = os.path.abspath(path)
+        if path != contract_file and path.startswith(_PROJECT_ROOT + os.sep):
+            deps[path] = os.stat(path).st_mtime_ns
+    
+    return [[path, mtime] for path, mtime in deps.items()]
+
+
+def _deps_unchanged(deps):
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime for path, mtime in deps)
+    except OSError:
+        return False
+
+
+def compile_contract_cached(contract_path):
+    """
+    Compiles a PyTeal contract to TEAL, reusing a cached result when the
+    contract file hasn't changed.
+
+    On a cache hit the contract module isn't even imported. Project
+    modules the contract imports from are recorded with the result, so
+    editing one of them also triggers a recompile.
+
+    Args:
+        contract_path: Path to the PyTeal contract (.py file)
+
+    Returns:
+        tuple: (approval_teal, clear_teal, metadata) or (None, None, None)
+
+    Raises:
+        ContractError: If the contract has no compile_contract() function
+    """
+    key = _teal_cache_key(contract_path)
+
+    cached = read_cached("teal", key)
+    data = json.loads(cached) if cached else None
+    if data and _deps_unchanged(data.get("deps", [])):
+        metadata = {
+            name: tuple(schema)
+            for name, schema in data["metadata"].items()
+        }
+        return data["approval"], data["clear"], metadata
+
+    contract_module = load_contract(contract_path)
+    if not contract_module:
+        return None, None, None
+
+    if not hasattr(contract_module, 'compile_contract'):
+        raise ContractError("Contract must have a 'compile_contract()' function")
+
+    approval_teal, clear_teal = contract_module.compile_contract()
+
+    # Get metadata if available
+    metadata = {}
+    if hasattr(contract_module, 'get_global_schema'):
+        metadata['global_schema'] = tuple(contract_module.get_global_schema())
+    if hasattr(contract_module, 'get_local_schema'):
+        metadata['local_schema'] = tuple(contract_module.get_local_schema())
+
+    write_cached("teal", key, json.dumps({
+        "approval": approval_teal,
+        "clear": clear_teal,
+        "metadata": metadata,
+        "deps": _module_deps(contract_module)
+    }).encode())
+
+    return approval_teal, clear_teal, metadata
+
+
+def _compiled_paths(name):
+    return (
+        os.path.join(COMPILED_DIR, f"{name}_approval.teal"),
+        os.path.join(COMPILED_DIR, f"{name}_clear.teal"),
+        os.path.join(COMPILED_DIR, f"{name}.meta.json")
+    )
+
+
+def _build_stamp(contract_path):
+    """
+    Returns the build-cache key of a contract and the dependencies
+    recorded by its compile, or None if it hasn't been compiled as it
+    is now.
+    """
+    key = _teal_cache_key(contract_path)
+    cached = read_cached("teal", key)
+    if not cached:
+        return None
+    return {"key": key, "deps": json.loads(cached).get("deps", [])}
+
+
+def save_teal(name, approval_teal, clear_teal, metadata, contract_path=None):
+    """
+    Saves compiled TEAL and the contract's schemas to compiled/.
+    
+    Args:
+        name: Contract name (file name without .py)
+        approval_teal: Approval program TEAL code
+        clear_teal: Clear state program TEAL code
+        metadata: Contract metadata (schemas), may be empty
+        contract_path: Contract the TEAL was compiled from by
+            compile_contract_cached(). Without it, get_teal() won't
+            reuse the saved files.
+        
+    Returns:
+        tuple: (approval_path, clear_path)
+    """
+    approval_path, clear_path, meta_path = _compiled_paths(name)
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    
+    # Write each program with a single binary write (encoded once,
+    # no text-mode wrapper)
+    Path(approval_path).write_bytes(approval_teal.encode('utf-8'))
+    Path(clear_path).write_bytes(clear_teal.encode('utf-8'))
+    
+    meta = {"metadata": metadata or {}}
+    if contract_path is not None:
+        meta.update(_build_stamp(contract_path) or {})
+    
+    # Written last, so a complete meta file means complete TEAL files
+    Path(meta_path).write_bytes(json.dumps(meta).encode())
+    
+    return approval_path, clear_path
+
+
+def _load_saved_teal(contract_path):
+    """
+    Reads TEAL saved by save_teal() if it was built from the contract as
+    it is now: same build-cache key (file and PyTeal version) and
+    unchanged dependencies.
+    """
+    name = os.path.splitext(os.path.basename(contract_path))[0]
+    approval_path, clear_path, meta_path = _compiled_paths(name)
+    
+    try:
+        meta = json.loads(Path(meta_path).read_bytes())
+        if meta.get("key") != _teal_cache_key(contract_path):
+            return None
+        if not _deps_unchanged(meta.get("deps", [])):
+            return None
+        approval_teal = Path(approval_path).read_text(encoding='utf-8')
+        clear_teal = Path(clear_path).read_text(encoding='utf-8')
+    except (OSError, ValueError, AttributeError):
+        return None
+    
+    metadata = {
+        name: tuple(schema)
+        for name, schema in meta["metadata"].items()
+    }
+    return approval_teal, clear_teal, metadata
+
+
+def get_teal(contract_path):
+    """
+    Gets the TEAL for a contract, compiling it only if needed.
+    
+    TEAL saved by compile_contract.py is used as-is when it was built
+    from the current contract, dependencies and PyTeal version;
+    otherwise this falls back to compile_contract_cached().
+    
+    Args:
+        contract_path: Path to the PyTeal contract (.py file)
+        
+    Returns:
+        tuple: (approval_teal, clear_teal, metadata) or (None, None, None)
+        
+    Raises:
+        ContractError: If the contract has no compile_contract() function
+    """
+    saved = _load_saved_teal(contract_path)
+    if saved:
+        return saved
+    return compile_contract_cached(contract_path)
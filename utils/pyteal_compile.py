@@ -0,0 +1,40 @@
+"""
+PyTeal Compilation Helper
+
+One place for the compiler settings the application contracts share:
+constants are assembled into intcblock/bytecblock and the scratch slot
+optimizer is enabled, which makes the TEAL (and the bytecode algod
+produces from it) smaller.
+
+Results are not memoized here: an expression's string form doesn't
+identify the program (subroutine calls render by name only). Each
+contract's compile_contract() is memoized, and its TEAL is cached on
+disk by utils/pipeline.py.
+"""
+
+from pyteal import Mode, OptimizeOptions, compileTeal
+
+
+# TEAL version the contracts in this repo target
+TEAL_VERSION = 8
+
+
+def compile_program(expr, mode=Mode.Application, version=TEAL_VERSION):
+    """
+    Compiles a PyTeal expression to TEAL with the optimizer enabled.
+    
+    Args:
+        expr: PyTeal expression (the program)
+        mode: Mode.Application or Mode.Signature (default: Application)
+        version: TEAL version (default: TEAL_VERSION)
+        
+    Returns:
+        str: Compiled TEAL code
+    """
+    return compileTeal(
+        expr,
+        mode=mode,
+        version=version,
+        assembleConstants=True,
+        optimize=OptimizeOptions(scratch_slots=True)
+    )
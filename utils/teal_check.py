@@ -0,0 +1,67 @@
+"""
+TEAL Pre-Check
+
+A quick local sanity check for TEAL source before it is sent to algod's
+compile endpoint. It doesn't replace the real assembler: it only makes
+sure every instruction line starts with a known opcode, so obvious
+mistakes (stray Python, typos, truncated output) fail immediately
+instead of after a network round-trip.
+"""
+
+
+# Opcodes and pseudo-ops accepted by the TEAL assembler (up to v10)
+TEAL_OPCODES = frozenset("""
+    ! != % & && * + - / < <= == > >= ^ | || ~
+    b b!= b% b& b* b+ b- b/ b< b<= b== b> b>= b^ b| b~
+    acct_params_get addr addw app_global_del app_global_get
+    app_global_get_ex app_global_put app_local_del app_local_get
+    app_local_get_ex app_local_put app_opted_in app_params_get arg arg_0
+    arg_1 arg_2 arg_3 args assert asset_holding_get asset_params_get
+    balance base64_decode bitlen block bnz box_create box_del box_extract
+    box_get box_len box_put box_replace box_resize box_splice bsqrt btoi
+    bury byte bytec bytec_0 bytec_1 bytec_2 bytec_3 bytecblock bz bzero
+    callsub concat cover dig divmodw divw dup dup2 dupn ec_add ec_map_to
+    ec_multi_scalar_mul ec_pairing_check ec_scalar_mul ec_subgroup_check
+    ecdsa_pk_decompress ecdsa_pk_recover ecdsa_verify ed25519verify
+    ed25519verify_bare err exp expw extract extract3 extract_uint16
+    extract_uint32 extract_uint64 falcon_verify frame_bury frame_dig gaid
+    gaids getbit getbyte gitxn gitxna gitxnas gload gloads gloadss global
+    gtxn gtxna gtxnas gtxns gtxnsa gtxnsas int intc intc_0 intc_1 intc_2
+    intc_3 intcblock itob itxn itxn_begin itxn_field itxn_next itxn_submit
+    itxna itxnas json_ref keccak256 len load loads log match method mimc
+    min_balance mulw online_stake pop popn proto pushbytes pushbytess
+    pushint pushints replace replace2 replace3 retsub return select setbit
+    setbyte sha256 sha3_256 sha512_256 shl shr sqrt store stores substring
+    substring3 sumhash512 swap switch txn txna txnas uncover
+    voter_params_get vrf_verify
+""".split())
+
+
+def find_invalid_line(source_code):
+    """
+    Finds the first line of TEAL that doesn't start with a known opcode.
+    
+    Blank lines, comments, #pragma directives and labels are skipped.
+    
+    Args:
+        source_code: TEAL source code string
+        
+    Returns:
+        tuple: (line_number, line) of the first bad line, or None
+    """
+    for line_number, line in enumerate(source_code.splitlines(), 1):
+        parts = line.split(None, 1)
+        if not parts:
+            continue
+        
+        token = parts[0]
+        if token in TEAL_OPCODES or token.startswith(('//', '#pragma')):
+            continue
+        
+        # Labels: "name:" optionally followed by a comment
+        if token.endswith(':') and (len(parts) == 1 or parts[1].startswith('//')):
+            continue
+        
+        return line_number, line
+    
+    return None